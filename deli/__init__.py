@@ -1,4 +1,7 @@
 from .__version__ import __version__
 from .serializer import *
 from .interface import *
+from .shared import *
+from .dedup import *
+from .prefetch import *
 from . import serializers
@@ -0,0 +1,114 @@
+import argparse
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Sequence, Optional
+
+from .interface import load, save
+
+
+def run():
+    sys.exit(1 if main() else 0)
+
+
+def main(args: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='deli', description='Smart serialization for (almost) any python object')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    convert = commands.add_parser('convert', help='convert files to a different format')
+    convert.add_argument('sources', nargs='+', type=Path, help='the files to convert')
+    convert.add_argument('--to', required=True, help="the target format's extension, e.g. .npy.gz")
+    convert.add_argument('-o', '--output', type=Path, help='the output folder, by default next to the sources')
+    convert.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='the number of processes')
+    convert.add_argument('-c', '--compression', type=int, help='the compression level, e.g. for .gz')
+    convert.add_argument('-f', '--force', action='store_true', help='convert even the up-to-date outputs')
+
+    args = parser.parse_args(args)
+    params = {}
+    if args.compression is not None:
+        params['compression'] = args.compression
+    return convert_files(args.sources, args.to, args.output, args.jobs, args.force, params)
+
+
+def convert_files(sources: Sequence[Path], extension: str, output: Optional[Path], jobs: int, force: bool,
+                  params: dict) -> int:
+    """Converts `sources` to `extension` in a process pool. Returns the number of failed files."""
+    pairs, skipped = [], 0
+    for source in sources:
+        target = (source.parent if output is None else output) / (_strip_extension(source.name) + extension)
+        # recompressing in place is never up to date
+        if not force and not _same_file(source, target) and _up_to_date(source, target):
+            skipped += 1
+        else:
+            pairs.append((source, target))
+
+    if output is not None:
+        output.mkdir(parents=True, exist_ok=True)
+
+    failed = total = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max(1, jobs)) as executor:
+        futures = {executor.submit(_convert, source, target, params): (source, target) for source, target in pairs}
+        for done, future in enumerate(as_completed(futures), 1):
+            source, target = futures[future]
+            try:
+                total += future.result()
+                status = f'{source} -> {target}'
+            except Exception as e:
+                failed += 1
+                status = f'{source}: {type(e).__name__}: {e}'
+
+            elapsed = time.perf_counter() - start
+            _log(f'[{done}/{len(pairs)}] {status} ({_throughput(done, total, elapsed)})')
+
+    elapsed = time.perf_counter() - start
+    _log(
+        f'Converted {len(pairs) - failed} files, skipped {skipped} up-to-date, failed {failed}. '
+        f'{total / 2 ** 20:.1f} MiB in {elapsed:.1f}s ({_throughput(len(pairs), total, elapsed)})'
+    )
+    return failed
+
+
+def _convert(source: Path, target: Path, params: dict) -> int:
+    size = source.stat().st_size
+    if not _same_file(source, target):
+        save(load(source), target, **params)
+        return size
+
+    # the source is replaced only after the new version is complete
+    temp = target.with_name(f'.{uuid.uuid4().hex}.{target.name}')
+    try:
+        save(load(source), temp, **params)
+        os.replace(temp, target)
+    finally:
+        if temp.exists():
+            temp.unlink()
+    return size
+
+
+def _strip_extension(name: str) -> str:
+    # compressed formats have a compound extension, e.g. .npy.gz
+    if name.endswith('.gz'):
+        name = name[:-3]
+    return os.path.splitext(name)[0]
+
+
+def _same_file(source: Path, target: Path) -> bool:
+    return source.resolve() == target.resolve()
+
+
+def _up_to_date(source: Path, target: Path) -> bool:
+    return target.exists() and target.stat().st_mtime >= source.stat().st_mtime
+
+
+def _throughput(files: int, size: int, elapsed: float) -> str:
+    elapsed = max(elapsed, 1e-9)
+    return f'{files / elapsed:.1f} files/s, {size / 2 ** 20 / elapsed:.1f} MiB/s'
+
+
+def _log(message: str):
+    print(message, file=sys.stderr, flush=True)
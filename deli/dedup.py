@@ -0,0 +1,201 @@
+import hashlib
+import json
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO, RawIOBase
+from pathlib import Path
+from typing import Any, Union, List
+
+from .interface import load, save
+from .serializer import MaybeHint, Hint
+
+__all__ = ['DedupStore']
+
+
+class DedupStore:
+    """
+    Stores serialized values split into content-defined chunks, so that similar values share most of their chunks.
+    Each unique chunk is stored only once, under its hash, and each value is described by a small manifest.
+
+    Chunks are only shared between uncompressed payloads, so prefer formats like .npy over .npy.gz.
+    Content-defined chunking requires numpy.
+    """
+
+    def __init__(self, root: Union[str, os.PathLike], *, chunk_size: int = 2 ** 16, workers: int = 8):
+        if not 2 ** 8 <= chunk_size <= 2 ** 24 or chunk_size & (chunk_size - 1):
+            raise ValueError(f'The chunk size must be a power of 2 between 2**8 and 2**24, not {chunk_size}')
+
+        self.root = Path(root)
+        self.chunk_size = chunk_size
+        self.workers = workers
+        (self.root / 'chunks').mkdir(parents=True, exist_ok=True)
+        (self.root / 'objects').mkdir(parents=True, exist_ok=True)
+
+    def save(self, value: Any, name: str, hint: MaybeHint = None, **kwargs) -> Hint:
+        """Save `value` under `name`. `hint` defaults to the name itself, e.g. "checkpoint.npy"."""
+        if hint is None:
+            hint = os.path.basename(name)
+
+        with ThreadPoolExecutor(self.workers) as executor:
+            with _ChunkWriter(self._store_chunk, self.chunk_size, executor) as writer:
+                result = save(value, writer, hint, **kwargs)
+            chunks = writer.chunks()
+
+        manifest = {'hint': result, 'size': sum(size for _, size in chunks), 'chunks': chunks}
+        _write_atomic(self._manifest(name), json.dumps(manifest).encode())
+        return result
+
+    def load(self, name: str, hint: MaybeHint = None, **kwargs) -> Any:
+        """Load the value stored under `name`. Its chunks are read in parallel."""
+        with open(self._manifest(name), 'r') as file:
+            manifest = json.load(file)
+
+        payload = bytearray(manifest['size'])
+        view = memoryview(payload)
+        digests, sizes, offsets, offset = [], [], [], 0
+        for digest, size in manifest['chunks']:
+            digests.append(digest)
+            sizes.append(size)
+            offsets.append(offset)
+            offset += size
+
+        def read(digest, size, start):
+            with open(self._chunk(digest), 'rb') as chunk:
+                if chunk.readinto(view[start:start + size]) != size:
+                    raise ValueError(f'The chunk {digest} is corrupted')
+
+        with ThreadPoolExecutor(self.workers) as executor:
+            list(executor.map(read, digests, sizes, offsets))
+
+        del view
+        return load(BytesIO(payload), manifest['hint'] if hint is None else hint, **kwargs)
+
+    def __contains__(self, name: str):
+        return self._manifest(name).exists()
+
+    def _store_chunk(self, chunk: bytes) -> str:
+        digest = hashlib.sha256(chunk).hexdigest()
+        path = self._chunk(digest)
+        if not path.exists():
+            _write_atomic(path, chunk)
+        return digest
+
+    def _chunk(self, digest: str) -> Path:
+        return self.root / 'chunks' / digest[:2] / digest[2:]
+
+    def _manifest(self, name: str) -> Path:
+        return self.root / 'objects' / f'{name}.json'
+
+
+class _ChunkWriter(RawIOBase):
+    def __init__(self, store, chunk_size: int, executor: ThreadPoolExecutor):
+        super().__init__()
+        self._store, self._executor = store, executor
+        # the chunk sizes are between a quarter and 4 times the average size
+        self._min_size, self._max_size = chunk_size // 4, chunk_size * 4
+        # the top bits of the hash are zero once per `chunk_size` bytes on average
+        bits = chunk_size.bit_length() - 1
+        self._mask = ((1 << bits) - 1) << (32 - bits)
+        self._pending = bytearray()
+        self._position = 0
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def write(self, data):
+        data = memoryview(data).cast('B')
+        self._pending += data
+        self._position += len(data)
+        # hashing is vectorized, so it's cheaper to process bigger blocks
+        if len(self._pending) >= 16 * self._max_size:
+            self._cut(False)
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._cut(True)
+        super().close()
+
+    def chunks(self) -> List[list]:
+        return [[future.result(), size] for future, size in self._chunks]
+
+    def _cut(self, final: bool):
+        start = 0
+        for end in _boundaries(self._pending, self._min_size, self._max_size, self._mask, final):
+            chunk = bytes(self._pending[start:end])
+            self._chunks.append((self._executor.submit(self._store, chunk), len(chunk)))
+            start = end
+        del self._pending[:start]
+
+
+def _boundaries(data: bytearray, min_size: int, max_size: int, mask: int, final: bool) -> List[int]:
+    """Finds the chunks' ends in `data` using a gear hash over a 32-byte window."""
+    import numpy as np
+
+    data = np.frombuffer(data, np.uint8)
+    # a chunk can end right after each of these positions
+    candidates = []
+    # small blocks keep the intermediate arrays in cache
+    for start in range(0, len(data), _BLOCK_SIZE):
+        # the window's previous bytes are needed as context
+        context = min(start, _WINDOW - 1)
+        hashes = _gear()[data[start - context:start + _BLOCK_SIZE]]
+        # h[i] = sum(gear[data[i - k]] << k for k in range(32)), computed by doubling the window
+        shifted = np.empty_like(hashes)
+        width = 1
+        while width < _WINDOW:
+            np.left_shift(hashes[:-width], np.uint32(width), out=shifted[width:])
+            shifted[:width] = 0
+            hashes += shifted
+            width *= 2
+
+        candidates.append(np.flatnonzero((hashes[context:] & np.uint32(mask)) == 0) + start)
+
+    candidates = np.concatenate(candidates) if candidates else np.array([], int)
+    ends, start, size = [], 0, len(data)
+    while start < size:
+        # min_size >= the window, so the hashes we look at never depend on the previous chunk
+        index = np.searchsorted(candidates, start + min_size - 1)
+        end = start + max_size
+        if index < len(candidates):
+            end = min(end, int(candidates[index]) + 1)
+
+        if end > size:
+            if final:
+                ends.append(size)
+            break
+
+        ends.append(end)
+        start = end
+
+    return ends
+
+
+_WINDOW, _BLOCK_SIZE = 32, 2 ** 16
+
+
+@lru_cache(None)
+def _gear():
+    import numpy as np
+
+    return np.array(
+        [int.from_bytes(hashlib.sha256(bytes([i])).digest()[:4], 'little') for i in range(256)], np.uint32
+    )
+
+
+def _write_atomic(path: Path, content: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f'.{uuid.uuid4().hex}.{path.name}')
+    try:
+        with open(temp, 'wb') as file:
+            file.write(content)
+        os.replace(temp, path)
+    finally:
+        if temp.exists():
+            temp.unlink()
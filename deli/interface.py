@@ -1,13 +1,17 @@
 import os
+import uuid
 from gzip import GzipFile
+from io import RawIOBase
 from os import PathLike
 from typing import Any, Optional, Union, BinaryIO
 
-from .serializer import MaybeHint, WrongSerializer, REGISTRY, Hint
+from .serializer import MaybeHint, WrongSerializer, REGISTRY, Hint, Info
 from .serializers.choice import Choice
+from .remote import is_url, load_url, info_url, url_name
+from .shared import is_shared, load_shared, save_shared
 
 __all__ = [
-    'load', 'save',
+    'load', 'save', 'info',
     'load_json', 'save_json',
     'load_pickle', 'save_pickle',
     'load_numpy', 'save_numpy',
@@ -19,12 +23,18 @@ __all__ = [
 def load(source: Union[str, PathLike, BinaryIO], hint: MaybeHint = None, **kwargs) -> Any:
     """
     Load a value from a file-like or buffer `source`.
+    `source` can also be a shared memory segment: ``shm://name``, or an ``http(s)://`` url.
     `hint` is used to override the format detection.
     `kwargs` are format-specific keyword arguments.
     """
-    choice = Choice(*REGISTRY)
+    choice = _registry()
 
     hint = _resolve_hint(hint, source)
+    if is_shared(source):
+        return load_shared(source, hint, kwargs)
+    if is_url(source):
+        return load_url(source, hint, kwargs)
+
     strict = hint is not None
     # TODO: what is it's both BinaryIO and PathLike?
     if isinstance(source, (str, PathLike)):
@@ -49,15 +59,26 @@ def load(source: Union[str, PathLike, BinaryIO], hint: MaybeHint = None, **kwarg
     return loader.load_buffer(source, hint, True, kwargs)
 
 
-def save(value: Any, destination: Union[str, PathLike, BinaryIO], hint: MaybeHint = None, **kwargs) -> Hint:
+def save(value: Any, destination: Union[str, PathLike, BinaryIO], hint: MaybeHint = None, *,
+         if_changed: bool = False, **kwargs) -> Hint:
     """
     Save `value` to a file-like or buffer `destination`.
+    `destination` can also be a new shared memory segment: ``shm://name``, see `unlink_shared` to remove it.
     `hint` is used to override the format detection.
+    `if_changed` leaves an existing file untouched, if its content is the same as the serialized `value`.
     `kwargs` are format-specific keyword arguments.
+    ``mode='append'`` extends existing .npy, .csv and .jsonl files instead of overwriting them.
     """
-    choice = Choice(*REGISTRY)
+    choice = _registry()
 
     hint = _resolve_hint(hint, destination)
+    if if_changed and (not isinstance(destination, (str, PathLike)) or is_shared(destination)):
+        raise ValueError('Only files can be saved with `if_changed`')
+    if if_changed and kwargs.get('mode', 'write') != 'write':
+        raise ValueError("`if_changed` can't be combined with `mode`")
+    if is_shared(destination):
+        return save_shared(value, destination, hint, kwargs)
+
     strict = hint is not None
     # TODO: what if it's both BinaryIO and PathLike?
     if isinstance(destination, (str, PathLike)):
@@ -67,6 +88,8 @@ def save(value: Any, destination: Union[str, PathLike, BinaryIO], hint: MaybeHin
             if loader is None:
                 raise WrongSerializer(f"Couldn't save value using {hint!r} as hint")
 
+        if if_changed and os.path.exists(destination):
+            return _save_if_changed(value, destination, hint, kwargs, choice, loader)
         return loader.save_path(value, destination, hint, kwargs)
 
     if not is_binary_io(destination):
@@ -82,6 +105,164 @@ def save(value: Any, destination: Union[str, PathLike, BinaryIO], hint: MaybeHin
     return loader.save_buffer(value, destination, hint, kwargs)
 
 
+def info(source: Union[str, PathLike, BinaryIO], hint: MaybeHint = None) -> Info:
+    """
+    Describe the value stored in `source` without loading it: its format, shape, dtype and size in memory.
+    Only the headers are read, e.g. compressed files are decompressed only as far as the header goes.
+    `hint` is used to override the format detection.
+    """
+    choice = _registry()
+
+    hint = _resolve_hint(hint, source)
+    if is_url(source):
+        return info_url(source, hint)
+
+    strict = hint is not None
+    if isinstance(source, (str, PathLike)):
+        loader = choice
+        if strict:
+            loader = choice.match_load_path(source, hint, {})
+            if loader is None:
+                raise WrongSerializer(f"Couldn't describe the value using {hint!r} as hint")
+
+        return loader.info_path(source, hint, {})
+
+    if not is_binary_io(source):
+        raise TypeError(f'Need a binary buffer, not {type(source).__name__}')
+
+    loader = choice
+    if strict:
+        loader = choice.match_load_buffer(hint, False, {})
+        if loader is None:
+            raise WrongSerializer(f"Couldn't describe the value using {hint!r} as hint")
+
+    return loader.info_buffer(source, hint, {})
+
+
+def _save_if_changed(value, destination, hint, params, choice, loader):
+    saver = choice
+    if hint is not None:
+        saver = choice.match_save_buffer(value, hint, params)
+
+    if saver is not None:
+        # the value is streamed over the existing content, which is only overwritten from the first difference
+        try:
+            with _Overwrite(destination) as buffer:
+                return saver.save_buffer(value, buffer, hint, params)
+        except WrongSerializer:
+            # some formats can be saved only to paths
+            if buffer.changed:
+                raise
+
+    # path-only formats are saved next to the destination, and replace it only if the content differs
+    folder, name = os.path.split(os.fspath(destination))
+    temp = os.path.join(folder, f'.{uuid.uuid4().hex}.{name}')
+    try:
+        result = loader.save_path(value, temp, hint, params)
+        if not _same_content(temp, destination):
+            os.replace(temp, destination)
+        return result
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+
+class _Overwrite(RawIOBase):
+    def __init__(self, path: PathLike):
+        super().__init__()
+        # some formats, e.g. gzip, store the file's name
+        self.name = os.fspath(path)
+        self._file = open(path, 'r+b')
+        self._position = self._end = 0
+        self.changed = False
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._end
+        self._position = self._file.seek(offset)
+        return self._position
+
+    def truncate(self, size=None):
+        if size is None:
+            size = self._position
+        self._end = size
+        if self.changed:
+            self._file.truncate(size)
+        return size
+
+    def write(self, data):
+        data = memoryview(data).cast('B')
+        size = len(data)
+        if not self.changed:
+            if self._file.read(size) == data:
+                self._position += size
+                self._end = max(self._end, self._position)
+                return size
+
+            self.changed = True
+            self._file.seek(self._position)
+
+        self._file.write(data)
+        self._position += size
+        self._end = max(self._end, self._position)
+        return size
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # the file is left as is, if nothing was written yet
+        if exc_type is not None and not self.changed:
+            self._file.close()
+        return super().__exit__(exc_type, exc_val, exc_tb)
+
+    def close(self):
+        if self.closed:
+            return
+
+        try:
+            if not self._file.closed:
+                self._file.seek(self._end)
+                if self.changed or self._file.read(1):
+                    self._file.truncate(self._end)
+        finally:
+            self._file.close()
+            super().close()
+
+
+def _same_content(first: PathLike, second: PathLike) -> bool:
+    if os.path.getsize(first) != os.path.getsize(second):
+        return False
+
+    with open(first, 'rb') as first, open(second, 'rb') as second:
+        while True:
+            chunk = first.read(_CHUNK_SIZE)
+            if chunk != second.read(_CHUNK_SIZE):
+                return False
+            if not chunk:
+                return True
+
+
+_CHUNK_SIZE = 1024 * 1024
+_CHOICE = Choice()
+
+
+def _registry() -> Choice:
+    # reuse the choice, and its per-type cache, as long as the registry doesn't change
+    global _CHOICE
+    if _CHOICE.choices != tuple(REGISTRY):
+        _CHOICE = Choice(*REGISTRY)
+    return _CHOICE
+
+
 def _resolve_hint(hint, path) -> MaybeHint:
     assert isinstance(hint, (str, bool)) or hint is None, hint
     if hint is None:
@@ -90,6 +271,8 @@ def _resolve_hint(hint, path) -> MaybeHint:
         return hint
     if not hint:
         return None
+    if is_url(path):
+        return url_name(path)
     if isinstance(path, (str, PathLike)):
         return os.path.basename(os.fspath(path))
     return None
@@ -0,0 +1,124 @@
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
+from typing import Any, Iterable, Optional
+
+from .interface import load
+
+__all__ = ['prefetch', 'Prefetch']
+
+
+def prefetch(sources: Iterable, *, workers: int = 4, max_bytes: Optional[int] = None, processes: bool = False,
+             **kwargs) -> 'Prefetch':
+    """
+    Load `sources` in the background and iterate over the values in the same order.
+    At most ``2 * workers`` values are loaded ahead, and no new loads are started while the values in flight take more
+    than `max_bytes` in memory. Values that are still loading are assumed to be as big as the last returned one.
+    If a value fails to load, its error is raised when the value's turn comes, and the iteration can go on after it.
+    `kwargs` are passed to `load`.
+
+    Processes avoid the GIL in heavy decoders, but the values are pickled on the way back.
+    """
+    return Prefetch(sources, workers, max_bytes, processes, kwargs)
+
+
+class Prefetch:
+    """An iterator over values that are loaded in the background, see `prefetch`."""
+
+    def __init__(self, sources: Iterable, workers: int, max_bytes: Optional[int], processes: bool, params: dict):
+        if workers < 1:
+            raise ValueError(f'At least one worker is required, not {workers}')
+
+        self._sources = iter(sources)
+        self._workers, self._max_bytes, self._params = workers, max_bytes, params
+        self._pending = deque()
+        # until the first value's size is known, a single value fits the budget
+        self._exhausted, self._estimate = False, max_bytes
+        self._executor = (ProcessPoolExecutor if processes else ThreadPoolExecutor)(workers)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Any:
+        if self._executor is None:
+            raise StopIteration
+
+        self._submit()
+        if not self._pending:
+            self.close()
+            raise StopIteration
+
+        # any exception is raised here, in the consumer's order
+        value = self._pending.popleft().result()
+        if self._max_bytes is not None:
+            self._estimate = _nbytes(value)
+        return value
+
+    def close(self):
+        """Cancel the pending loads and stop the workers."""
+        if self._executor is None:
+            return
+
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown()
+        self._executor = None
+
+    def __del__(self):
+        # an abandoned iterator shouldn't keep loading values nobody will use
+        if getattr(self, '_executor', None) is not None:
+            for future in self._pending:
+                future.cancel()
+            self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _submit(self):
+        pending, max_bytes = self._pending, self._max_bytes
+        while not self._exhausted and len(pending) < 2 * self._workers and (
+                not pending or max_bytes is None or _in_flight(pending, self._estimate) < max_bytes):
+            try:
+                source = next(self._sources)
+            except StopIteration:
+                self._exhausted = True
+                break
+
+            pending.append(self._executor.submit(load, source, **self._params))
+
+
+def _in_flight(pending: Iterable[Future], estimate: int) -> int:
+    total = 0
+    for future in pending:
+        if not future.done():
+            total += estimate
+        elif future.exception() is None:
+            total += _nbytes(future.result())
+    return total
+
+
+def _nbytes(value: Any) -> int:
+    """A rough size of `value` in memory."""
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return sum(map(_nbytes, value))
+    if isinstance(value, dict):
+        return sum(map(_nbytes, value.values()))
+    # e.g. dataframes
+    usage = getattr(value, 'memory_usage', None)
+    if callable(usage):
+        try:
+            return int(usage(deep=True).sum())
+        except (TypeError, AttributeError):
+            pass
+
+    # e.g. arrays and tensors
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+    return sys.getsizeof(value)
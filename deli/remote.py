@@ -0,0 +1,211 @@
+import errno
+import http.client
+import threading
+from io import RawIOBase, SEEK_SET, SEEK_CUR, SEEK_END
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlsplit, unquote
+
+from .serializer import MaybeHint, Info
+from .serializers.helpers import hand_over
+
+SCHEMES = 'http://', 'https://'
+TIMEOUT = 60
+# reads are rounded up to at least this size, which grows while the file is read sequentially
+_MIN_BLOCK, _MAX_BLOCK = 2 ** 16, 2 ** 24
+_MAX_IDLE = 8
+
+
+def is_url(x) -> bool:
+    return isinstance(x, str) and x.startswith(SCHEMES)
+
+
+def url_name(url: str) -> str:
+    """The file name in `url`, without the query."""
+    return unquote(urlsplit(url).path.rsplit('/', 1)[-1])
+
+
+def load_url(source: str, hint: MaybeHint, params: dict) -> Any:
+    """
+    Load a value from a remote file. Only the requested byte ranges are downloaded,
+    so that headers and slices of lazy arrays don't require the whole file.
+    """
+    from .interface import load
+
+    file = HTTPFile(source)
+    try:
+        value = load(file, hint, **params)
+    except BaseException:
+        file.close()
+        raise
+
+    hand_over(value, file)
+    return value
+
+
+def info_url(source: str, hint: MaybeHint) -> Info:
+    from .interface import info
+
+    with HTTPFile(source) as file:
+        return info(file, hint)
+
+
+class HTTPFile(RawIOBase):
+    """
+    A read-only seekable remote file, fetched with range requests over pooled keep-alive connections.
+    If the server doesn't support ranges, the whole file is downloaded once and kept in memory.
+    """
+
+    def __init__(self, url: str):
+        super().__init__()
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f'Unsupported url: {url!r}')
+
+        self.name = url
+        self._key = parts.scheme, parts.hostname, parts.port
+        self._target = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+        self._position = self._start = 0
+        self._data = memoryview(b'')
+        self._block = _MIN_BLOCK
+        self._size = None
+        # the first block also gives us the file's size
+        self._fetch(0, _MIN_BLOCK)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=SEEK_SET):
+        if whence == SEEK_CUR:
+            offset += self._position
+        elif whence == SEEK_END:
+            offset += self._size
+        if offset < 0:
+            raise ValueError('Negative seek position')
+        self._position = offset
+        return offset
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def read(self, size=-1):
+        self._checkClosed()
+        end = self._size if size is None or size < 0 else min(self._size, self._position + size)
+        parts = []
+        while self._position < end:
+            offset = self._position - self._start
+            if not 0 <= offset < len(self._data):
+                self._fetch(self._position, end - self._position)
+                # a server can ignore the range and send the whole file
+                offset = self._position - self._start
+
+            part = self._data[offset:offset + end - self._position]
+            parts.append(part)
+            self._position += len(part)
+
+        return b''.join(parts)
+
+    def close(self):
+        self._data = memoryview(b'')
+        super().close()
+
+    def _fetch(self, start: int, size: int):
+        if start == self._start + len(self._data):
+            self._block = min(self._block * 2, _MAX_BLOCK)
+        else:
+            self._block = _MIN_BLOCK
+        size = max(size, self._block)
+
+        headers = {'Range': f'bytes={start}-{start + size - 1}'}
+        status, headers, body = _request(self._key, 'GET', self._target, headers)
+        if status == 206:
+            if not body:
+                raise OSError(f'The server returned an empty range for {self.name!r}')
+            self._start, self._data = start, memoryview(body)
+            total = headers.get('Content-Range', '').rpartition('/')[2]
+            if self._size is None:
+                self._size = int(total) if total.isdigit() else self._content_length()
+
+        elif status == 200:
+            # the server ignores ranges
+            self._start, self._data, self._size = 0, memoryview(body), len(body)
+
+        elif status == 416 and self._size is None:
+            # the range starts after the end of the file, e.g. it's empty
+            self._size = int(headers.get('Content-Range', '').rpartition('/')[2] or 0)
+
+        else:
+            _raise_for_status(status, self.name)
+
+    def _content_length(self) -> int:
+        status, headers, _ = _request(self._key, 'HEAD', self._target, {})
+        if status != 200:
+            _raise_for_status(status, self.name)
+        return int(headers['Content-Length'])
+
+
+def _raise_for_status(status: int, url: str):
+    if status == 404:
+        raise FileNotFoundError(errno.ENOENT, 'The remote file was not found', url)
+    raise OSError(f"Couldn't read {url!r}: HTTP status {status}")
+
+
+# idle connections by (scheme, host, port)
+_POOL: Dict[tuple, List[http.client.HTTPConnection]] = {}
+_LOCK = threading.Lock()
+
+
+def _request(key: tuple, method: str, target: str, headers: dict) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    while True:
+        connection, reused = _acquire(key)
+        try:
+            connection.request(method, target, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            connection.close()
+            # the server has closed an idle connection, so we retry with a new one
+            if reused:
+                continue
+            raise
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            _release(key, connection)
+        return response.status, response.headers, body
+
+
+def _acquire(key: tuple) -> Tuple[http.client.HTTPConnection, bool]:
+    with _LOCK:
+        idle = _POOL.get(key)
+        if idle:
+            return idle.pop(), True
+
+    scheme, host, port = key
+    factory = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+    return factory(host, port, timeout=TIMEOUT), False
+
+
+def _release(key: tuple, connection: http.client.HTTPConnection):
+    with _LOCK:
+        idle = _POOL.setdefault(key, [])
+        if len(idle) < _MAX_IDLE:
+            idle.append(connection)
+            return
+
+    connection.close()
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from os import PathLike
 from pathlib import Path
-from typing import Any, Union, BinaryIO, Optional
+from typing import Any, Union, BinaryIO, Optional, NamedTuple, Tuple
 
 Hint = str
 MaybeHint = Union[str, None]
@@ -10,7 +10,23 @@ MaybeSerializer = Optional['Serializer']
 REGISTRY = []
 
 
+class Info(NamedTuple):
+    """What a value would look like after loading, as far as the file's headers can tell."""
+    format: Hint
+    # `None` stands for unknown values
+    shape: Optional[Tuple[Optional[int], ...]]
+    dtype: Any
+    nbytes: Optional[int]
+
+
 class Serializer(ABC):
+    def match_value(self, value: Any) -> bool:
+        """
+        A cheap check whether `value` can be saved by this serializer at all.
+        The result must depend only on the type of `value`, because it is cached per type.
+        """
+        return True
+
     # save
     @abstractmethod
     def match_save_buffer(self, value: Any, hint: MaybeHint, params: dict) -> MaybeSerializer:
@@ -45,6 +61,14 @@ class Serializer(ABC):
     def load_path(self, source: PathLike, hint: Hint, params: dict) -> Any:
         pass
 
+    # info
+    # these are optional and use the same matching as loading
+    def info_buffer(self, source: BinaryIO, hint: MaybeHint, params: dict) -> Info:
+        raise WrongSerializer
+
+    def info_path(self, source: PathLike, hint: Hint, params: dict) -> Info:
+        raise WrongSerializer
+
 
 class WrongSerializer(Exception):
     pass
@@ -4,4 +4,5 @@ from .images import *
 from .csv import *
 from .dicom import *
 from .nifty import *
+from .sparse import *
 from .helpers import *
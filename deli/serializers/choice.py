@@ -2,12 +2,17 @@ from os import PathLike
 from typing import Any, BinaryIO, Sequence
 
 from .. import Hint, MaybeHint
-from ..serializer import Serializer, WrongSerializer, RequireLazy, MaybeSerializer
+from ..serializer import Serializer, WrongSerializer, RequireLazy, MaybeSerializer, Info
 
 
 class Choice(Serializer):
     def __init__(self, *choices: Serializer):
         self.choices = choices
+        # type -> serializers that can possibly save values of this type
+        self._by_type = {}
+
+    def match_value(self, value: Any) -> bool:
+        return bool(self._candidates(value))
 
     # matching
 
@@ -27,7 +32,7 @@ class Choice(Serializer):
 
     def save_buffer(self, value: Any, destination: BinaryIO, hint: MaybeHint, params: dict) -> Hint:
         position = destination.tell()
-        for choice in self.choices:
+        for choice in self._candidates(value):
             try:
                 return choice.save_buffer(value, destination, hint, params)
             except WrongSerializer:
@@ -38,7 +43,7 @@ class Choice(Serializer):
         raise WrongSerializer('No serializer was able to save the value')
 
     def save_path(self, value: Any, destination: PathLike, hint: Hint, params: dict) -> Hint:
-        for choice in self.choices:
+        for choice in self._candidates(value):
             try:
                 return choice.save_path(value, destination, hint, params)
             except WrongSerializer:
@@ -74,8 +79,37 @@ class Choice(Serializer):
 
         raise WrongSerializer('No serializer was able to load the value')
 
+    # info
+
+    def info_buffer(self, source: BinaryIO, hint: MaybeHint, params: dict) -> Info:
+        position = source.tell()
+        for choice in self.choices:
+            try:
+                return choice.info_buffer(source, hint, params)
+            except WrongSerializer:
+                if position != source.tell():
+                    source.seek(position)
+
+        raise WrongSerializer('No serializer was able to describe the value')
+
+    def info_path(self, source: PathLike, hint: Hint, params: dict) -> Info:
+        for choice in self.choices:
+            try:
+                return choice.info_path(source, hint, params)
+            except WrongSerializer:
+                pass
+
+        raise WrongSerializer('No serializer was able to describe the value')
+
     # internals
 
+    def _candidates(self, value) -> Sequence[Serializer]:
+        kind = type(value)
+        candidates = self._by_type.get(kind)
+        if candidates is None:
+            candidates = self._by_type[kind] = tuple(choice for choice in self.choices if choice.match_value(value))
+        return candidates
+
     def _match(self, match):
         results = []
         for choice in self.choices:
@@ -1,8 +1,8 @@
 from os import PathLike
 from typing import BinaryIO, Any, Union
 
-from ..serializer import MaybeHint, REGISTRY, Hint, WrongSerializer
-from .helpers import ExtensionMatch, SourceAgnostic
+from ..serializer import MaybeHint, REGISTRY, Hint, WrongSerializer, Info
+from .helpers import ExtensionMatch, SourceAgnostic, split_mode, appends_to
 from .packaged import Gzip
 
 
@@ -13,7 +13,7 @@ class CSV(ExtensionMatch, SourceAgnostic):
         return isinstance(value, (DataFrame, Series))
 
     def _match_save_params(self, params: dict):
-        return set(params) <= {'index'}
+        return set(params) <= {'index', 'mode'}
 
     def load(self, source: Union[PathLike, BinaryIO], hint: MaybeHint, params) -> Any:
         try:
@@ -23,8 +23,30 @@ class CSV(ExtensionMatch, SourceAgnostic):
                 raise
             raise WrongSerializer from e
 
+    def info(self, source: Union[PathLike, BinaryIO], hint: MaybeHint, params) -> Info:
+        # only the header is parsed, so the number of rows and the dtypes are unknown
+        try:
+            columns = pd.read_csv(source, nrows=0).columns
+        except pd.errors.EmptyDataError as e:
+            if hint is not None:
+                raise
+            raise WrongSerializer from e
+
+        return Info('.csv', (None, len(columns)), None, None)
+
     def save(self, value: Any, destination: Union[PathLike, BinaryIO], hint: MaybeHint, params) -> Hint:
-        value.to_csv(destination, **params)
+        mode, params = split_mode(params)
+        if appends_to(destination, mode):
+            # the rows are only appended if they have the same header
+            expected = value.head(0).to_csv(**params).rstrip('\r\n')
+            with open(destination, 'r', newline='') as file:
+                header = file.readline().rstrip('\r\n')
+            if header != expected:
+                raise ValueError(f"The columns don't match the existing file's header: {expected!r} vs {header!r}")
+
+            value.to_csv(destination, mode='a', header=False, **params)
+        else:
+            value.to_csv(destination, **params)
         return '.csv'
 
 
@@ -1,7 +1,7 @@
 from os import PathLike
 from typing import BinaryIO, Any, Union
 
-from ..serializer import MaybeHint, REGISTRY, Hint, WrongSerializer
+from ..serializer import MaybeHint, REGISTRY, Hint, WrongSerializer, Info
 from .helpers import ExtensionMatch, SourceAgnostic
 from .packaged import Gzip
 
@@ -24,6 +24,31 @@ class DICOM(ExtensionMatch, SourceAgnostic):
         pydicom.dcmwrite(destination, value)
         return '.dcm'
 
+    def info(self, source: Union[PathLike, BinaryIO], hint: MaybeHint, params) -> Info:
+        # the shape and dtype describe the dataset's `pixel_array`
+        try:
+            header = pydicom.dcmread(source, stop_before_pixels=True)
+        except pydicom.errors.InvalidDicomError as e:
+            if hint is not None:
+                raise
+            raise WrongSerializer from e
+
+        if 'Rows' not in header or 'Columns' not in header:
+            return Info('.dcm', None, None, None)
+
+        shape = header.Rows, header.Columns
+        frames, channels = int(header.get('NumberOfFrames', 1) or 1), header.get('SamplesPerPixel', 1)
+        if frames > 1:
+            shape = (frames, *shape)
+        if channels > 1:
+            shape = (*shape, channels)
+
+        import numpy as np
+
+        bits = header.get('BitsAllocated', 8)
+        dtype = np.dtype(f'{"i" if header.get("PixelRepresentation", 0) else "u"}{max(bits // 8, 1)}')
+        return Info('.dcm', shape, dtype, dtype.itemsize * int(np.prod(shape)))
+
 
 try:
     import pydicom
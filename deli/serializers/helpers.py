@@ -1,8 +1,9 @@
+import os
 from abc import ABC, abstractmethod
 from os import PathLike
 from typing import Any, Union, BinaryIO, Tuple
 
-from ..serializer import Serializer, MaybeHint, WrongSerializer, Hint, MaybeSerializer
+from ..serializer import Serializer, MaybeHint, WrongSerializer, Hint, MaybeSerializer, Info
 
 
 class NoBuffer(Serializer, ABC):
@@ -42,6 +43,10 @@ class PathAsBuffer(Serializer, ABC):
         with open(destination, 'wb') as buffer:
             return self.save_buffer(value, buffer, hint, params)
 
+    def info_path(self, source: PathLike, hint: Hint, params: dict) -> Info:
+        with open(source, 'rb') as buffer:
+            return self.info_buffer(buffer, hint, params)
+
 
 class SourceAgnostic(Serializer, ABC):
     @abstractmethod
@@ -64,6 +69,15 @@ class SourceAgnostic(Serializer, ABC):
     def save_buffer(self, value: Any, destination: BinaryIO, hint: MaybeHint, params: dict) -> Hint:
         return self.save(value, destination, hint, params)
 
+    def info(self, source: Union[PathLike, BinaryIO], hint: MaybeHint, params) -> Info:
+        raise WrongSerializer
+
+    def info_path(self, source: PathLike, hint: Hint, params: dict) -> Info:
+        return self.info(source, hint, params)
+
+    def info_buffer(self, source: BinaryIO, hint: MaybeHint, params: dict) -> Info:
+        return self.info(source, hint, params)
+
 
 class ExtensionMatch(Serializer, ABC):
     extensions: Tuple[str]
@@ -80,6 +94,9 @@ class ExtensionMatch(Serializer, ABC):
     def _match_save_params(self, params: dict):
         return not params
 
+    def match_value(self, value: Any) -> bool:
+        return self._match_value(value)
+
     def match_save_buffer(self, value: Any, hint: MaybeHint, params: dict) -> MaybeSerializer:
         return self._match_save(value, hint, params)
 
@@ -107,3 +124,36 @@ class ExtensionMatch(Serializer, ABC):
         if not self._match_name(hint):
             return
         return self
+
+
+SAVE_MODES = 'write', 'append'
+
+
+def split_mode(params: dict) -> Tuple[str, dict]:
+    """Separates the ``mode`` save parameter from the rest of `params`."""
+    params = params.copy()
+    mode = params.pop('mode', 'write')
+    if mode not in SAVE_MODES:
+        raise ValueError(f'Unknown save mode {mode!r}. Available modes: {", ".join(SAVE_MODES)}')
+    return mode, params
+
+
+def appends_to(destination, mode: str) -> bool:
+    """Whether the value must be appended to an existing non-empty file."""
+    if mode != 'append':
+        return False
+    if not isinstance(destination, (str, PathLike)):
+        raise ValueError('Only files can be appended to')
+    return os.path.exists(destination) and os.path.getsize(destination) > 0
+
+
+def hand_over(value, stream):
+    """
+    Lazy values keep reading from `stream` after loading, so they become responsible for closing it.
+    Any other value doesn't need the stream anymore, and it is closed right away.
+    """
+    owned = getattr(value, 'owned', None)
+    if owned is None:
+        stream.close()
+    else:
+        owned.append(stream)
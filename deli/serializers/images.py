@@ -1,7 +1,9 @@
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from os import PathLike
 from typing import Any, BinaryIO, Union
 
-from ..serializer import MaybeHint, REGISTRY, Hint, WrongSerializer
+from ..serializer import MaybeHint, REGISTRY, Hint, WrongSerializer, Info
 from .helpers import ExtensionMatch, SourceAgnostic
 
 
@@ -24,6 +26,185 @@ class ImageIO(ExtensionMatch, SourceAgnostic):
         imwrite(destination, value, extension=hint)
         return hint
 
+    def info(self, source: Union[PathLike, BinaryIO], hint: MaybeHint, params) -> Info:
+        if isinstance(source, (str, PathLike)):
+            with open(source, 'rb') as file:
+                return self.info(file, hint, params)
+
+        start = source.tell()
+        magic = source.read(8)
+        if magic == _PNG_MAGIC:
+            parse = _png_header
+        elif magic[:4] in _TIFF_MAGIC:
+            parse = _tiff_header
+        else:
+            raise WrongSerializer
+
+        source.seek(start)
+        try:
+            fmt, shape, dtype = parse(source)
+        except struct.error as e:
+            raise WrongSerializer from e
+        dtype = np.dtype(dtype)
+        return Info(fmt, shape, dtype, dtype.itemsize * int(np.prod(shape)))
+
+
+class TiledTIFF(ExtensionMatch, SourceAgnostic):
+    """
+    Large tiled TIFF images, e.g. whole-slide or microscopy scans.
+    ``region`` - a tuple of slices - decodes only the tiles that intersect it, in parallel ``workers`` threads.
+    ``tile`` and ``compression`` control the saved file's layout.
+    """
+    extensions = '.tif', '.tiff'
+
+    def _match_value(self, value):
+        return isinstance(value, np.ndarray)
+
+    def _match_load_params(self, params: dict):
+        return bool(params) and set(params) <= {'region', 'workers'}
+
+    def _match_save_params(self, params: dict):
+        return bool(params) and set(params) <= {'tile', 'compression'}
+
+    def load(self, source: Union[PathLike, BinaryIO], hint: MaybeHint, params) -> Any:
+        region = params.get('region')
+        with tifffile.TiffFile(source) as file:
+            page = file.pages[0]
+            if region is None:
+                return page.asarray()
+
+            region = region if isinstance(region, tuple) else (region,)
+            # volumes and separate color planes are rare enough to be decoded whole
+            if not page.is_tiled or page.planarconfig != 1 or page.imagedepth > 1:
+                return page.asarray()[region]
+            return _read_region(file, page, region, params.get('workers'))
+
+    def save(self, value: Any, destination: Union[PathLike, BinaryIO], hint: MaybeHint, params) -> Hint:
+        tifffile.imwrite(destination, value, tile=params.get('tile', (256, 256)), compression=params.get('compression'))
+        return '.tif'
+
+
+def _read_region(file, page, region, workers):
+    region = region + (slice(None),) * (2 - len(region))
+    rows, cols, rest = region[0], region[1], region[2:]
+    if not isinstance(rows, slice) or not isinstance(cols, slice):
+        raise TypeError(f'The region must start with 2 slices, not {region}')
+
+    height, width = page.imagelength, page.imagewidth
+    y_start, y_stop, y_step = rows.indices(height)
+    x_start, x_stop, x_step = cols.indices(width)
+    if y_step < 0 or x_step < 0:
+        raise ValueError('Negative steps are not supported')
+    y_stop, x_stop = max(y_start, y_stop), max(x_start, x_stop)
+
+    tile_height, tile_width = page.tilelength, page.tilewidth
+    across = -(-width // tile_width)
+    tiles = [
+        row * across + col
+        for row in range(y_start // tile_height, -(-y_stop // tile_height))
+        for col in range(x_start // tile_width, -(-x_stop // tile_width))
+    ]
+    # reading is sequential, only the decoding is parallel
+    handle, chunks = file.filehandle, []
+    for index in tiles:
+        handle.seek(page.dataoffsets[index])
+        chunks.append(handle.read(page.databytecounts[index]))
+
+    result = np.zeros((y_stop - y_start, x_stop - x_start, page.samplesperpixel), page.dtype)
+
+    def place(index, data):
+        segment, (*_, y, x, _), _ = page.decode(data, index, jpegtables=page.jpegtables)
+        if segment is None:
+            return
+
+        segment = segment[0]
+        top, left = max(y, y_start), max(x, x_start)
+        bottom, right = min(y + segment.shape[0], y_stop), min(x + segment.shape[1], x_stop)
+        result[top - y_start:bottom - y_start, left - x_start:right - x_start] = \
+            segment[top - y:bottom - y, left - x:right - x]
+
+    with ThreadPoolExecutor(workers) as executor:
+        list(executor.map(place, tiles, chunks))
+
+    if len(page.shape) == 2:
+        result = result[..., 0]
+    return result[(slice(None, None, y_step), slice(None, None, x_step), *rest)]
+
+
+_PNG_MAGIC = b'\x89PNG\r\n\x1a\n'
+# color type -> number of channels. Palettes are decoded as RGB
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+
+
+def _png_header(source: BinaryIO):
+    header = source.read(8 + 8 + 13)
+    if len(header) < 29 or header[12:16] != b'IHDR':
+        raise WrongSerializer
+    width, height, depth, color = struct.unpack('>IIBB', header[16:26])
+    if color not in _PNG_CHANNELS:
+        raise WrongSerializer(f'Unknown PNG color type: {color}')
+    channels = _PNG_CHANNELS[color]
+    shape = (height, width) if channels == 1 else (height, width, channels)
+    if color == 0 and depth == 1:
+        # black and white images are decoded as masks
+        return '.png', shape, 'bool'
+    return '.png', shape, 'uint16' if depth == 16 else 'uint8'
+
+
+# byte order, version
+_TIFF_MAGIC = {b'II*\x00': ('<', 42), b'MM\x00*': ('>', 42), b'II+\x00': ('<', 43), b'MM\x00+': ('>', 43)}
+_TIFF_KINDS = {1: 'u', 2: 'i', 3: 'f'}
+# field type -> struct format
+_TIFF_TYPES = {1: 'B', 3: 'H', 4: 'I', 16: 'Q'}
+_TIFF_WIDTH, _TIFF_HEIGHT, _TIFF_BITS, _TIFF_SAMPLES, _TIFF_PLANAR, _TIFF_FORMAT = 256, 257, 258, 277, 284, 339
+
+
+def _tiff_header(source: BinaryIO):
+    """Parses the first image file directory (IFD) of a classic or a big TIFF."""
+    start = source.tell()
+    order, version = _TIFF_MAGIC[source.read(4)]
+    if version == 42:
+        pointer, count_format, entry_format = 'I', 'H', 'HHI4s'
+        offset, = struct.unpack(order + 'I', source.read(4))
+    else:
+        pointer, count_format, entry_format = 'Q', 'Q', 'HHQ8s'
+        _, _, offset = struct.unpack(order + 'HHQ', source.read(12))
+
+    source.seek(start + offset)
+    count, = struct.unpack(order + count_format, source.read(struct.calcsize(count_format)))
+    entries = [
+        struct.unpack(order + entry_format, source.read(struct.calcsize(order + entry_format)))
+        for _ in range(count)
+    ]
+
+    tags = {}
+    for tag, kind, count, value in entries:
+        if kind not in _TIFF_TYPES:
+            continue
+        kind = order + _TIFF_TYPES[kind]
+        size = struct.calcsize(kind)
+        # we only need the first value of each tag. Longer values are stored elsewhere
+        if count * size > len(value):
+            source.seek(start + struct.unpack(order + pointer, value)[0])
+            value = source.read(size)
+        tags[tag] = struct.unpack(kind, value[:size])[0]
+
+    if _TIFF_WIDTH not in tags or _TIFF_HEIGHT not in tags:
+        raise WrongSerializer
+    height, width = tags[_TIFF_HEIGHT], tags[_TIFF_WIDTH]
+    bits, channels = tags.get(_TIFF_BITS, 1), tags.get(_TIFF_SAMPLES, 1)
+    kind = _TIFF_KINDS.get(tags.get(_TIFF_FORMAT, 1), 'u')
+
+    if channels == 1:
+        shape = height, width
+    elif tags.get(_TIFF_PLANAR, 1) == 2:
+        # the channels are stored separately, and decoded as the first axis
+        shape = channels, height, width
+    else:
+        shape = height, width, channels
+    dtype = 'bool' if bits == 1 else f'{kind}{max(bits // 8, 1)}'
+    return '.tif', shape, dtype
+
 
 try:
     try:
@@ -46,3 +227,12 @@ try:
 
 except ImportError:
     pass
+
+try:
+    import numpy as np
+    import tifffile
+
+    REGISTRY.append(TiledTIFF())
+
+except ImportError:
+    pass
@@ -3,10 +3,10 @@ from typing import Any
 
 from .helpers import ExtensionMatch, NoBuffer
 from .packaged import Gzip
-from ..serializer import REGISTRY, Hint
+from ..serializer import REGISTRY, Hint, Info
 
 
-class Nifty(ExtensionMatch, NoBuffer):
+class Nifty(NoBuffer, ExtensionMatch):
     extensions = '.nii', '.nii.gz'
 
     def _match_value(self, value):
@@ -21,6 +21,15 @@ class Nifty(ExtensionMatch, NoBuffer):
             return '.nii'
         return hint
 
+    def info_path(self, source: PathLike, hint: Hint, params: dict) -> Info:
+        # nibabel only reads the header until the data is accessed
+        image = nibabel.load(source, **params)
+        dtype = image.get_data_dtype()
+        return Info(
+            '.nii.gz' if str(source).endswith('.gz') else '.nii', image.shape, dtype,
+            dtype.itemsize * int(np.prod(image.shape)),
+        )
+
 
 # TODO:
 # load from buffer
@@ -39,6 +48,7 @@ class Nifty(ExtensionMatch, NoBuffer):
 
 try:
     import nibabel
+    import numpy as np
     from nibabel import Nifti1Image
 
     REGISTRY.append(Nifty())
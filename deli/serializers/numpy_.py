@@ -1,23 +1,51 @@
+import ast
+import operator
+import os
+import struct
 from os import PathLike
 from typing import Any, BinaryIO
 
 from . import ExtensionMatch
+from .helpers import split_mode, appends_to
 from .packaged import Gzip
-from ..serializer import MaybeHint, REGISTRY, Hint, WrongSerializer
+from ..serializer import MaybeHint, REGISTRY, Hint, WrongSerializer, Info, RequireLazy
 
 
 class Numpy(ExtensionMatch):
+    """
+    Arrays in numpy's .npy format.
+    With ``lazy=True`` files are memory-mapped and buffers are wrapped in a `LazyArray`, which reads only the
+    requested rows.
+    """
     extensions = '.npy',
 
     def _match_value(self, value):
         return isinstance(value, (np.ndarray, np.generic))
 
+    def _match_load_params(self, params: dict):
+        return set(params) <= {'lazy'}
+
+    def _match_save_params(self, params: dict):
+        return set(params) <= {'mode'}
+
     def save_buffer(self, value: Any, destination: BinaryIO, hint: MaybeHint, params: dict) -> Hint:
-        np.save(destination, value, allow_pickle=False)
+        mode, _ = split_mode(params)
+        appends_to(destination, mode)
+        save_array(destination, value)
         return '.npy'
 
     def save_path(self, value: Any, destination: PathLike, hint: Hint, params: dict) -> Hint:
-        np.save(destination, value, allow_pickle=False)
+        mode, _ = split_mode(params)
+        if appends_to(destination, mode):
+            append(destination, value)
+        else:
+            # the destination is truncated only if the value can be saved
+            value = np.asanyarray(value)
+            if value.dtype.hasobject:
+                raise ValueError('Object arrays cannot be saved when allow_pickle=False')
+            header = array_header(value)
+            with open(destination, 'wb') as file:
+                save_array(file, value, header)
         return '.npy'
 
     def load_buffer(self, source: BinaryIO, hint: MaybeHint, allow_lazy: bool, params: dict) -> Any:
@@ -28,6 +56,10 @@ class Numpy(ExtensionMatch):
                 raise WrongSerializer
             source.seek(position)
 
+        if params.get('lazy'):
+            if not allow_lazy:
+                raise RequireLazy('Lazy arrays keep reading from the source, which must stay open')
+            return LazyArray(source)
         return np.load(source, allow_pickle=False)
 
     def load_path(self, source: PathLike, hint: Hint, params: dict) -> Any:
@@ -36,7 +68,242 @@ class Numpy(ExtensionMatch):
                 if file.read(6) != b'\x93NUMPY':
                     raise WrongSerializer
 
-        return np.load(source, allow_pickle=False)
+        return np.load(source, mmap_mode='r' if params.get('lazy') else None, allow_pickle=False)
+
+    def info_buffer(self, source: BinaryIO, hint: MaybeHint, params: dict) -> Info:
+        try:
+            shape, _, dtype = read_header(source)
+        except ValueError as e:
+            raise WrongSerializer from e
+
+        return Info('.npy', shape, dtype, dtype.itemsize * int(np.prod(shape)))
+
+    def info_path(self, source: PathLike, hint: Hint, params: dict) -> Info:
+        with open(source, 'rb') as file:
+            return self.info_buffer(file, hint, params)
+
+
+class LazyArray:
+    """
+    An array stored in a seekable .npy stream, e.g. a `SeekableGzip`.
+    Indexing along the first axis reads only the requested rows, any other indexing reads the whole array.
+    """
+
+    def __init__(self, source: BinaryIO):
+        self.shape, self.fortran_order, self.dtype = read_header(source)
+        if self.dtype.hasobject:
+            raise ValueError('Arrays of objects require pickle and cannot be loaded lazily')
+        self.source = source
+        # the streams to close together with the array, see `hand_over`
+        self.owned = []
+        self.offset = source.tell()
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.dtype.itemsize
+
+    def __len__(self):
+        if not self.shape:
+            raise TypeError('len() of unsized object')
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = key,
+        if self.fortran_order or not self.shape or not key:
+            return self.read()[key]
+
+        first, rest, length = key[0], key[1:], self.shape[0]
+        if isinstance(first, slice):
+            rows = range(*first.indices(length))
+            if not rows:
+                return self._rows(0, 0)[rest]
+
+            block = self._rows(min(rows), max(rows) + 1)
+            # the block starts at the first requested row
+            if rows.step < 0:
+                block = block[::-1]
+            return block[(slice(None, None, abs(rows.step)),) + rest]
+
+        try:
+            index = operator.index(first)
+        except TypeError:
+            # fancy indexing, new axes, ellipsis
+            return self.read()[key]
+
+        if not -length <= index < length:
+            raise IndexError(f'index {index} is out of bounds for axis 0 with size {length}')
+        index %= length
+        return self._rows(index, index + 1)[(0,) + rest]
+
+    def read(self) -> 'np.ndarray':
+        """Reads the whole array."""
+        self.source.seek(self.offset)
+        if self.fortran_order:
+            return self._read(self.shape[::-1]).transpose()
+        return self._read(self.shape)
+
+    def close(self):
+        for stream in self.owned:
+            stream.close()
+
+    def __array__(self, dtype=None, copy=None):
+        value = self.read()
+        return value if dtype is None else value.astype(dtype, copy=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f'{type(self).__name__}(shape={self.shape}, dtype={self.dtype})'
+
+    def _rows(self, start: int, stop: int) -> 'np.ndarray':
+        self.source.seek(self.offset + start * self.dtype.itemsize * int(np.prod(self.shape[1:])))
+        return self._read((stop - start, *self.shape[1:]))
+
+    def _read(self, shape) -> 'np.ndarray':
+        result = np.empty(shape, self.dtype)
+        view = memoryview(result.reshape(-1).view(np.uint8))
+        position = 0
+        while position < len(view):
+            count = self.source.readinto(view[position:])
+            if not count:
+                raise ValueError('The stream ended before the end of the array')
+            position += count
+
+        return result
+
+
+def read_header(source: BinaryIO):
+    """Reads the header of a .npy payload and leaves `source` at the beginning of the data."""
+    version = np.lib.format.read_magic(source)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(source)
+    if version == (2, 0):
+        return np.lib.format.read_array_header_2_0(source)
+    # utf8 headers, e.g. for non-latin field names, have no public reader
+    size, = struct.unpack('<I', source.read(4))
+    header = ast.literal_eval(source.read(size).decode('utf8'))
+    return header['shape'], header['fortran_order'], np.lib.format.descr_to_dtype(header['descr'])
+
+
+# room for the first axis to grow to any int64, same as numpy>=1.24 leaves
+_GROWTH = 21
+_ALIGN = 64
+# version -> the header length's format, the header's encoding
+_VERSIONS = {(1, 0): ('<H', 'latin1'), (2, 0): ('<I', 'latin1'), (3, 0): ('<I', 'utf8')}
+_WRITE_BUFFER = 16 * 2 ** 20
+
+
+def array_header(value) -> bytes:
+    """
+    The .npy header of `value`, the same as numpy>=1.24 writes.
+    Unlike older numpy versions, the header is always padded, so that `append` can grow the shape in place.
+    """
+    header = np.lib.format.header_data_from_array_1_0(value)
+    text = '{' + ''.join(f"'{key}': {header[key]!r}, " for key in sorted(header)) + '}'
+    shape = header['shape']
+    if shape:
+        text += ' ' * (_GROWTH - len(repr(shape[-1 if header['fortran_order'] else 0])))
+
+    for version, (length, encoding) in _VERSIONS.items():
+        try:
+            encoded = text.encode(encoding)
+        except UnicodeEncodeError:
+            continue
+
+        prefix = 8 + struct.calcsize(length)
+        # the data is aligned, and the header ends with a newline
+        padding = _ALIGN - (prefix + len(encoded) + 1) % _ALIGN
+        size = len(encoded) + padding + 1
+        if size < 2 ** (8 * struct.calcsize(length)):
+            return b'\x93NUMPY' + bytes(version) + struct.pack(length, size) + encoded + b' ' * padding + b'\n'
+
+    raise ValueError('The header is too big to be saved')
+
+
+def write_header(destination: BinaryIO, value):
+    """Writes the header of `value` in the .npy format, see `array_header`."""
+    destination.write(array_header(value))
+
+
+def save_array(destination: BinaryIO, value, header: bytes = None):
+    """
+    Same as ``np.save(destination, value, allow_pickle=False)``, but with a header that `append` can grow.
+    `header` can be precomputed with `array_header`.
+    """
+    value = np.asanyarray(value)
+    if value.dtype.hasobject:
+        raise ValueError('Object arrays cannot be saved when allow_pickle=False')
+    if header is None:
+        header = array_header(value)
+
+    destination.write(header)
+    if value.flags.f_contiguous and not value.flags.c_contiguous:
+        value = value.T
+    if value.flags.c_contiguous:
+        destination.write(value.reshape(-1).view(np.uint8))
+        return
+
+    # strided views are written in chunks instead of a full copy, same as numpy does
+    buffer_size = max(_WRITE_BUFFER // value.itemsize, 1) if value.itemsize else 0
+    for chunk in np.nditer(value, ['external_loop', 'buffered', 'zerosize_ok'], buffersize=buffer_size, order='C'):
+        destination.write(chunk.tobytes('C'))
+
+
+def append(path: PathLike, value):
+    """
+    Extends the array stored at `path` along the first axis.
+    Only the data and the shape in the header are written, the existing data is left untouched.
+    """
+    value = np.asanyarray(value)
+    with open(path, 'r+b') as file:
+        shape, fortran_order, dtype = read_header(file)
+        start = file.tell()
+        if not shape or fortran_order and len(shape) > 1:
+            raise ValueError('Only C-ordered arrays with at least one dimension can be appended to')
+        if value.shape[1:] != shape[1:] or value.ndim != len(shape):
+            raise ValueError(f"Can't append an array of shape {value.shape} to an array of shape {shape}")
+        if dtype.hasobject or not np.can_cast(value.dtype, dtype, 'safe'):
+            raise ValueError(f"Can't append an array of dtype {value.dtype} to an array of dtype {dtype}")
+
+        end = file.seek(0, os.SEEK_END)
+        if end != start + dtype.itemsize * int(np.prod(shape)):
+            raise ValueError(f"The file's size ({end}) doesn't match the array in its header")
+
+        # the header's length field is right after the magic, and its width depends on the version
+        file.seek(6)
+        version = tuple(file.read(2))
+        size = start - (10 if version == (1, 0) else 12)
+        shape = (shape[0] + len(value), *shape[1:])
+        header = "{'descr': %r, 'fortran_order': False, 'shape': %r, }" % (
+            np.lib.format.dtype_to_descr(dtype), shape
+        )
+        header = header.encode(_VERSIONS.get(version, (None, 'latin1'))[1])
+        if len(header) < size:
+            file.seek(end)
+            file.write(np.ascontiguousarray(value, dtype).data)
+            file.seek(start - size)
+            file.write(header.ljust(size - 1) + b'\n')
+            return
+
+    # not enough padding left in the header, e.g. the file was written by an older numpy.
+    # The new header has enough room for the following appends
+    value = np.concatenate([np.load(path), value.astype(dtype, copy=False)])
+    header = array_header(value)
+    with open(path, 'wb') as file:
+        save_array(file, value, header)
 
 
 try:
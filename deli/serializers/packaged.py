@@ -1,7 +1,9 @@
 import json
+import os
 import pickle
 from gzip import GzipFile
 from io import TextIOWrapper
+from os import PathLike
 from typing import Any, BinaryIO
 
 try:
@@ -10,8 +12,9 @@ except ImportError:
     # for py3.6
     BadGzipFile = OSError
 
-from .helpers import ExtensionMatch, PathAsBuffer
-from ..serializer import Serializer, MaybeSerializer, MaybeHint, WrongSerializer, REGISTRY, Hint
+from .helpers import ExtensionMatch, PathAsBuffer, split_mode, appends_to, hand_over
+from .seekable_gzip import SeekableGzip, IndexWriter
+from ..serializer import Serializer, MaybeSerializer, MaybeHint, WrongSerializer, REGISTRY, Hint, Info
 
 
 class JSON(PathAsBuffer, ExtensionMatch):
@@ -32,6 +35,11 @@ class JSON(PathAsBuffer, ExtensionMatch):
             wrapper.detach()
 
     def save_buffer(self, value: Any, destination: BinaryIO, hint: MaybeHint, params: dict) -> Hint:
+        # the precheck only helps to pick a serializer for unhinted values,
+        # and a custom encoder can handle anything, so we can only precheck the default one
+        if hint is None and 'cls' not in params and not _is_jsonable(value):
+            raise WrongSerializer
+
         wrapper = TextIOWrapper(destination)
         try:
             json.dump(value, wrapper, **params)
@@ -43,6 +51,64 @@ class JSON(PathAsBuffer, ExtensionMatch):
         return '.json'
 
 
+class JSONLines(PathAsBuffer, ExtensionMatch):
+    extensions = '.jsonl',
+
+    def _match_value(self, value):
+        return isinstance(value, (list, tuple))
+
+    def _match_save_params(self, params: dict):
+        return set(params) <= {'mode'}
+
+    def load_buffer(self, source: BinaryIO, hint: MaybeHint, allow_lazy: bool, params: dict) -> Any:
+        wrapper = TextIOWrapper(source)
+        try:
+            return [json.loads(line) for line in wrapper if line.strip()]
+        except (TypeError, json.JSONDecodeError) as e:
+            if hint is not None:
+                raise
+            raise WrongSerializer from e
+        finally:
+            wrapper.detach()
+
+    def save_buffer(self, value: Any, destination: BinaryIO, hint: MaybeHint, params: dict) -> Hint:
+        mode, _ = split_mode(params)
+        appends_to(destination, mode)
+        self._write(value, destination)
+        return '.jsonl'
+
+    def save_path(self, value: Any, destination: PathLike, hint: Hint, params: dict) -> Hint:
+        mode, _ = split_mode(params)
+        if not appends_to(destination, mode):
+            return super().save_path(value, destination, hint, params)
+
+        with open(destination, 'r+b') as file:
+            # the records are only appended if they have the same keys
+            first = json.loads(file.readline())
+            if isinstance(first, dict) and any(not isinstance(x, dict) or x.keys() != first.keys() for x in value):
+                raise ValueError(f"The records' keys don't match the existing records: {list(first)}")
+
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b'\n':
+                file.write(b'\n')
+            self._write(value, file)
+
+        return '.jsonl'
+
+    @staticmethod
+    def _write(value, destination):
+        if not _is_jsonable(value):
+            raise WrongSerializer
+
+        wrapper = TextIOWrapper(destination)
+        try:
+            for entry in value:
+                wrapper.write(json.dumps(entry))
+                wrapper.write('\n')
+        finally:
+            wrapper.detach()
+
+
 class Pickle(ExtensionMatch, PathAsBuffer):
     extensions = '.pkl',
 
@@ -83,6 +149,9 @@ class Gzip(PathAsBuffer, Serializer):
         self.serializer = serializer
         self._ext = '.gz'
 
+    def match_value(self, value: Any) -> bool:
+        return self.serializer.match_value(value)
+
     def _match(self, name):
         return name is not None and name.endswith(self._ext)
 
@@ -90,11 +159,13 @@ class Gzip(PathAsBuffer, Serializer):
         return None if name is None else name[:-len(self._ext)]
 
     def match_save_buffer(self, value: Any, hint: MaybeHint, params: dict) -> MaybeSerializer:
-        if not self._match(hint):
+        # compressed streams can't be extended in place
+        if not self._match(hint) or params.get('mode', 'write') != 'write':
             return
 
         params = params.copy()
         params.pop('compression', None)
+        params.pop('seekable', None)
         child = self.serializer.match_save_buffer(value, self._trim(hint), params)
         if child is None:
             return
@@ -110,6 +181,9 @@ class Gzip(PathAsBuffer, Serializer):
         return Gzip(child)
 
     def load_buffer(self, source: BinaryIO, hint: MaybeHint, allow_lazy: bool, params: dict) -> Any:
+        if allow_lazy and params.get('lazy'):
+            return self._load_seekable(SeekableGzip(source), hint, params)
+
         try:
             with GzipFile(fileobj=source, mode='rb') as local:
                 return self.serializer.load_buffer(local, self._trim(hint), allow_lazy, params)
@@ -118,14 +192,53 @@ class Gzip(PathAsBuffer, Serializer):
                 raise
             raise WrongSerializer from e
 
+    def load_path(self, source: PathLike, hint: Hint, params: dict) -> Any:
+        if not params.get('lazy'):
+            return super().load_path(source, hint, params)
+        # the file stays open as long as the lazy value reads from it
+        return self._load_seekable(SeekableGzip(open(source, 'rb'), owns=True), hint, params)
+
+    def _load_seekable(self, local: SeekableGzip, hint: MaybeHint, params: dict) -> Any:
+        try:
+            value = self.serializer.load_buffer(local, self._trim(hint), True, params)
+        except BaseException as e:
+            local.close()
+            if isinstance(e, BadGzipFile) and not self.match_load_buffer(hint, True, params):
+                raise WrongSerializer from e
+            raise
+
+        hand_over(value, local)
+        return value
+
+    def info_buffer(self, source: BinaryIO, hint: MaybeHint, params: dict) -> Info:
+        # only the beginning of the stream is decompressed, as far as the inner serializer reads it
+        try:
+            with GzipFile(fileobj=source, mode='rb') as local:
+                result = self.serializer.info_buffer(local, self._trim(hint), params)
+        except BadGzipFile as e:
+            if self.match_load_buffer(hint, False, params):
+                raise
+            raise WrongSerializer from e
+
+        return result._replace(format=result.format + self._ext)
+
     def save_buffer(self, value: Any, destination: BinaryIO, hint: MaybeHint, params: dict) -> Hint:
         params = params.copy()
         compression = params.pop('compression', 1)
+        # access points let `SeekableGzip` start decompressing in the middle of the stream
+        seekable = params.pop('seekable', False)
+        # a fixed mtime keeps the output deterministic, which `save(..., if_changed=True)` relies on
         mtime = 0
 
         try:
+            start = destination.tell()
             with GzipFile(fileobj=destination, mode='wb', compresslevel=compression, mtime=mtime) as local:
+                if seekable:
+                    local = IndexWriter(local, destination, start)
                 result = self.serializer.save_buffer(value, local, self._trim(hint), params)
+
+            if seekable:
+                destination.write(local.index_member())
         except BadGzipFile as e:
             if self.match_save_buffer(value, hint, params):
                 raise
@@ -134,6 +247,32 @@ class Gzip(PathAsBuffer, Serializer):
         return result + self._ext
 
 
+_JSON_SCALARS = str, int, float, bool, type(None)
+
+
+def _is_jsonable(value, _visited=None) -> bool:
+    """Checks whether the default json encoder is able to dump `value` without writing anything."""
+    if isinstance(value, _JSON_SCALARS):
+        return True
+    if not isinstance(value, (dict, list, tuple)):
+        return False
+
+    if _visited is None:
+        _visited = set()
+    # circular references are reported by the encoder itself
+    if id(value) in _visited:
+        return True
+    _visited.add(id(value))
+    try:
+        if isinstance(value, dict):
+            return all(
+                isinstance(k, _JSON_SCALARS) and _is_jsonable(v, _visited) for k, v in value.items()
+            )
+        return all(_is_jsonable(v, _visited) for v in value)
+    finally:
+        _visited.remove(id(value))
+
+
 REGISTRY.extend((
-    JSON(), Text(), Pickle(),
+    JSON(), Text(), JSONLines(), Pickle(),
 ))
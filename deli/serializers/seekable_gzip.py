@@ -0,0 +1,217 @@
+"""
+Random access into gzip streams.
+
+While compressing, the deflate stream is fully flushed every `span` bytes, so that decompression can restart at these
+access points without any history. Their offsets are stored in an extra field of an empty gzip member appended to the
+stream, which keeps the file a regular multi-member gzip stream for every other tool.
+"""
+import io
+import struct
+import zlib
+from gzip import GzipFile
+from typing import BinaryIO, List, Optional, Tuple
+
+try:
+    from gzip import BadGzipFile
+except ImportError:
+    # for py3.6
+    BadGzipFile = OSError
+
+__all__ = ['SeekableGzip']
+
+# compressed offset, uncompressed offset
+AccessPoint = Tuple[int, int]
+
+SPAN = 2 ** 20
+_CHUNK_SIZE = 2 ** 16
+_FIELD_ID = b'dI'
+_POINT = struct.Struct('<QQ')
+_LENGTH = struct.Struct('<I')
+# the empty deflate stream, the crc and the size of the empty member
+_EMPTY = b'\x03\x00' + bytes(8)
+# the extra field must fit into 2**16 - 1 bytes
+_MAX_POINTS = (2 ** 16 - 1 - 4 - _LENGTH.size) // _POINT.size
+
+
+class IndexWriter(io.RawIOBase):
+    """Adds access points to a gzip stream that is being written."""
+
+    def __init__(self, local: GzipFile, destination: BinaryIO, start: int, span: int = SPAN):
+        super().__init__()
+        self.local, self.destination, self.start, self.span = local, destination, start, span
+        self.points: List[AccessPoint] = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def write(self, data):
+        data = memoryview(data).cast('B')
+        offset = 0
+        while offset < len(data):
+            boundary = (self._position // self.span + 1) * self.span
+            part = data[offset:offset + boundary - self._position]
+            self.local.write(part)
+            self._position += len(part)
+            offset += len(part)
+
+            if self._position == boundary:
+                self.local.flush(zlib.Z_FULL_FLUSH)
+                self.points.append((self.destination.tell() - self.start, self._position))
+                if len(self.points) > _MAX_POINTS:
+                    # too many points to store: keep every other one
+                    self.points = self.points[1::2]
+                    self.span *= 2
+
+        return len(data)
+
+    def index_member(self) -> bytes:
+        """An empty gzip member that stores the access points."""
+        payload = b''.join(_POINT.pack(*point) for point in self.points)
+        size = 10 + 2 + 4 + len(payload) + _LENGTH.size + len(_EMPTY)
+        field = _FIELD_ID + struct.pack('<H', len(payload) + _LENGTH.size) + payload + _LENGTH.pack(size)
+        # magic, deflate, FEXTRA, mtime 0, no extra flags, unknown OS
+        header = b'\x1f\x8b\x08\x04' + bytes(4) + b'\x00\xff' + struct.pack('<H', len(field))
+        return header + field + _EMPTY
+
+
+def read_index(source: BinaryIO) -> Optional[List[AccessPoint]]:
+    """Reads the access points stored at the end of `source`, if any. The position of `source` is preserved."""
+    position = source.tell()
+    try:
+        end = source.seek(0, io.SEEK_END)
+        tail = _LENGTH.size + len(_EMPTY)
+        if end - position < tail:
+            return None
+
+        source.seek(end - tail)
+        tail = source.read(tail)
+        if tail[_LENGTH.size:] != _EMPTY:
+            return None
+        size, = _LENGTH.unpack(tail[:_LENGTH.size])
+        if size > end - position or size < 16 + _LENGTH.size + len(_EMPTY):
+            return None
+
+        source.seek(end - size)
+        member = source.read(size)
+        if member[:4] != b'\x1f\x8b\x08\x04' or member[12:14] != _FIELD_ID:
+            return None
+        payload = member[16:-_LENGTH.size - len(_EMPTY)]
+        if len(payload) % _POINT.size:
+            return None
+        return [point for point in _POINT.iter_unpack(payload)]
+
+    finally:
+        source.seek(position)
+
+
+class SeekableGzip(io.RawIOBase):
+    """
+    A read-only gzip stream that seeks using the stored access points, if there are any.
+    Otherwise, like `GzipFile`, backward seeks decompress the stream from the start.
+    """
+
+    def __init__(self, source: BinaryIO, owns: bool = False):
+        super().__init__()
+        self.source, self.owns = source, owns
+        self.start = source.tell()
+        self.points = read_index(source) or []
+        self._restart(0, 0)
+        # an empty stream is not an error
+        self._fresh = True
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            # the size is only known after decompressing everything
+            while self.read(_CHUNK_SIZE * 16):
+                pass
+            offset += self._position
+        if offset < 0:
+            raise ValueError('Negative seek position')
+
+        # the closest point before the target, unless the current position is already closer
+        compressed, uncompressed = max(
+            [(0, 0)] + [point for point in self.points if point[1] <= offset], key=lambda x: x[1]
+        )
+        if not uncompressed <= self._position <= offset:
+            self._restart(compressed, uncompressed)
+
+        while self._position < offset:
+            if not self.read(min(offset - self._position, _CHUNK_SIZE * 16)):
+                break
+        return self._position
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            return b''.join(iter(lambda: self.read(_CHUNK_SIZE * 16), b''))
+
+        result = []
+        while size > 0 and not self._done:
+            data = self._decompressor.unconsumed_tail or self._pending or self.source.read(_CHUNK_SIZE)
+            self._pending = b''
+            if self._fresh:
+                # members can be separated by zero padding
+                data = data.lstrip(b'\x00')
+            if not data:
+                if not self._fresh:
+                    raise EOFError('Compressed file ended before the end-of-stream marker was reached')
+                self._done = True
+                break
+
+            self._fresh = False
+            try:
+                chunk = self._decompressor.decompress(data, size)
+            except zlib.error as e:
+                raise BadGzipFile(str(e)) from e
+            result.append(chunk)
+            size -= len(chunk)
+            self._position += len(chunk)
+            if self._decompressor.eof:
+                self._next_member(self._decompressor.unused_data)
+
+        return b''.join(result)
+
+    def close(self):
+        if not self.closed and self.owns:
+            self.source.close()
+        super().close()
+
+    def _restart(self, compressed: int, uncompressed: int):
+        self.source.seek(self.start + compressed)
+        self._position = uncompressed
+        self._done = self._fresh = False
+        self._pending = b''
+        # access points are in the middle of a member, so the stream is raw deflate up to the member's trailer
+        self._raw = compressed > 0
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS if self._raw else 16 + zlib.MAX_WBITS)
+
+    def _next_member(self, leftover: bytes):
+        if self._raw:
+            # skip the crc and size, which are checked by the gzip decoder otherwise
+            if len(leftover) < 8:
+                leftover += self.source.read(8 - len(leftover))
+            leftover = leftover[8:]
+            self._raw = False
+
+        self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self._pending = leftover
+        self._fresh = True
@@ -0,0 +1,134 @@
+import struct
+import zipfile
+from io import UnsupportedOperation
+from os import PathLike
+from typing import Any, BinaryIO, Union
+
+from ..serializer import MaybeHint, REGISTRY, Hint, WrongSerializer
+from .helpers import ExtensionMatch, SourceAgnostic
+from .packaged import Gzip
+
+
+class Sparse(ExtensionMatch, SourceAgnostic):
+    """
+    Stores the component arrays of scipy's sparse matrices and arrays, same as `scipy.sparse.save_npz`.
+    Uncompressed files can be memory-mapped with ``mmap_mode``.
+    """
+    extensions = '.npz',
+
+    def _match_value(self, value):
+        return scipy.sparse.issparse(value)
+
+    def _match_load_params(self, params: dict):
+        return set(params) <= {'mmap_mode'}
+
+    def _match_save_params(self, params: dict):
+        return set(params) <= {'compressed'}
+
+    def load(self, source: Union[PathLike, BinaryIO], hint: MaybeHint, params) -> Any:
+        mmap_mode = params.get('mmap_mode')
+        try:
+            if mmap_mode is None:
+                return scipy.sparse.load_npz(source)
+
+            if not isinstance(source, (str, PathLike)):
+                raise ValueError('Only files can be memory-mapped')
+            return _load_mapped(source, mmap_mode)
+
+        except (ValueError, OSError, KeyError, zipfile.BadZipFile) as e:
+            if hint is not None:
+                raise
+            raise WrongSerializer from e
+
+    def save(self, value: Any, destination: Union[PathLike, BinaryIO], hint: MaybeHint, params) -> Hint:
+        if isinstance(destination, (str, PathLike)):
+            with open(destination, 'wb') as file:
+                return self.save(value, file, hint, params)
+
+        # zipfile seeks back to patch the headers, which e.g. gzip streams can't do.
+        # Without `seek` it writes the sizes after each member instead
+        scipy.sparse.save_npz(_Stream(destination), value, compressed=params.get('compressed', False))
+        return '.npz'
+
+
+class _Stream:
+    def __init__(self, file: BinaryIO):
+        self.file = file
+
+    # numpy only treats objects with `read` as files
+    def read(self, *args):
+        raise UnsupportedOperation
+
+    def write(self, data):
+        return self.file.write(data)
+
+    def tell(self):
+        return self.file.tell()
+
+    def flush(self):
+        return self.file.flush()
+
+
+# the arrays that are worth mapping
+_COMPONENTS = {'data', 'indices', 'indptr', 'offsets', 'row', 'col', 'coords'}
+_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')
+
+
+def _load_mapped(path: PathLike, mmap_mode: str):
+    from .numpy_ import read_header
+
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as file:
+        # same as scipy's error for regular archives
+        if 'format.npy' not in archive.namelist():
+            raise ValueError(f'The file {path} does not contain a sparse array or matrix.')
+
+        for info in archive.infolist():
+            name = info.filename[:-4] if info.filename.endswith('.npy') else info.filename
+            with archive.open(info) as member:
+                if name not in _COMPONENTS:
+                    arrays[name] = np.lib.format.read_array(member, allow_pickle=False)
+                    continue
+
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise ValueError("Compressed files can't be memory-mapped")
+                shape, fortran_order, dtype = read_header(member)
+                header = member.tell()
+
+            # the member's data starts right after its local header
+            file.seek(info.header_offset)
+            local = _LOCAL_HEADER.unpack(file.read(_LOCAL_HEADER.size))
+            offset = info.header_offset + _LOCAL_HEADER.size + local[-2] + local[-1] + header
+            if np.prod(shape) == 0:
+                arrays[name] = np.empty(shape, dtype)
+            else:
+                arrays[name] = np.memmap(
+                    path, dtype, mmap_mode, offset, shape, order='F' if fortran_order else 'C'
+                )
+
+    kind = arrays['format'].item()
+    if not isinstance(kind, str):
+        kind = kind.decode('ascii')
+    cls = getattr(scipy.sparse, kind + ('_array' if arrays.get('_is_array') else '_matrix'))
+    shape = tuple(arrays['shape'])
+
+    if kind in ('csc', 'csr', 'bsr'):
+        return cls((arrays['data'], arrays['indices'], arrays['indptr']), shape=shape)
+    if kind == 'dia':
+        return cls((arrays['data'], arrays['offsets']), shape=shape)
+    if kind == 'coo':
+        if 'coords' in arrays:
+            return cls((arrays['data'], arrays['coords']), shape=shape)
+        return cls((arrays['data'], (arrays['row'], arrays['col'])), shape=shape)
+    raise ValueError(f"Can't load sparse data of format {kind!r}")
+
+
+try:
+    import numpy as np
+    import scipy.sparse
+
+    REGISTRY.append(Sparse())
+    REGISTRY.append(Gzip(Sparse()))
+
+except ImportError:
+    pass
@@ -0,0 +1,151 @@
+import os
+import struct
+import sys
+from io import BytesIO
+from typing import Any
+
+from .serializer import MaybeHint, Hint
+
+__all__ = ['unlink_shared']
+
+SCHEME = 'shm://'
+# every segment starts with the payload's length, because the OS is free to round the segment's size up
+_PREFIX = struct.Struct('<Q')
+
+
+def is_shared(x) -> bool:
+    return isinstance(x, str) and x.startswith(SCHEME)
+
+
+def save_shared(value: Any, destination: str, hint: MaybeHint, params: dict) -> Hint:
+    """
+    Save `value` to a new shared memory segment.
+    On posix systems the segment outlives the current process and must be removed with `unlink_shared`.
+    Windows frees a segment as soon as its last handle is closed, so there the segment is gone right after saving,
+    unless another process already has it open.
+    """
+    name = _name(destination)
+    if _is_plain_array(value, hint, params):
+        # the array is copied straight into the segment, without an intermediate buffer
+        from .serializers.numpy_ import write_header, np
+
+        header = BytesIO()
+        write_header(header, value)
+        header = header.getvalue()
+        size = len(header) + value.nbytes
+
+        segment = _open(name, create=True, size=_PREFIX.size + size)
+        try:
+            segment.buf[:_PREFIX.size] = _PREFIX.pack(size)
+            segment.buf[_PREFIX.size:_PREFIX.size + len(header)] = header
+            fortran_order = value.flags.f_contiguous and not value.flags.c_contiguous
+            np.ndarray(
+                value.shape, value.dtype, segment.buf, _PREFIX.size + len(header), order='F' if fortran_order else 'C'
+            )[...] = value
+        finally:
+            segment.close()
+        return '.npy'
+
+    from .interface import save
+
+    buffer = BytesIO()
+    result = save(value, buffer, hint, **params)
+    payload = buffer.getbuffer()
+    segment = _open(name, create=True, size=_PREFIX.size + len(payload))
+    try:
+        segment.buf[:_PREFIX.size] = _PREFIX.pack(len(payload))
+        segment.buf[_PREFIX.size:_PREFIX.size + len(payload)] = payload
+    finally:
+        del payload
+        segment.close()
+    return result
+
+
+def load_shared(source: str, hint: MaybeHint, params: dict) -> Any:
+    """
+    Load a value from an existing shared memory segment.
+    Arrays are not copied: they are read-only views of the segment, which stay valid even after it is unlinked.
+    """
+    segment = _open(_name(source))
+    try:
+        size, = _PREFIX.unpack(segment.buf[:_PREFIX.size])
+        payload = segment.buf[_PREFIX.size:_PREFIX.size + size]
+        try:
+            if (hint is None or hint.endswith('.npy')) and not params and payload[:6] == b'\x93NUMPY':
+                from .serializers.numpy_ import read_header, np
+
+                # the header's length is stored right after the magic and version
+                if payload[6] == 1:
+                    start = 10 + struct.unpack('<H', payload[8:10])[0]
+                else:
+                    start = 12 + struct.unpack('<I', payload[8:12])[0]
+                shape, fortran_order, dtype = read_header(BytesIO(payload[:start]))
+
+                # the mapping is handed over to the array, so it lives exactly as long as the array itself
+                mapping = _detach(segment)
+                array = np.ndarray(
+                    shape, dtype, mapping, _PREFIX.size + start, order='F' if fortran_order else 'C'
+                )
+                array.flags.writeable = False
+                return array
+
+            from .interface import load
+
+            return load(BytesIO(payload), hint, **params)
+        finally:
+            del payload
+
+    finally:
+        segment.close()
+
+
+def unlink_shared(name: str):
+    """Remove the shared memory segment `name`, with or without the ``shm://`` prefix."""
+    if is_shared(name):
+        name = _name(name)
+    segment = _open(name, track=True)
+    segment.close()
+    segment.unlink()
+
+
+def _name(x: str) -> str:
+    return x[len(SCHEME):]
+
+
+def _is_plain_array(value, hint, params):
+    # no need to import numpy if the value can't be an array anyway
+    numpy = sys.modules.get('numpy')
+    return (
+            numpy is not None and type(value) is numpy.ndarray and not value.dtype.hasobject and
+            hint is not None and hint.endswith('.npy') and not params
+    )
+
+
+def _open(name, create=False, size=0, track=False):
+    try:
+        from multiprocessing.shared_memory import SharedMemory
+    except ImportError as e:
+        raise RuntimeError('Shared memory segments require python>=3.8') from e
+
+    if track:
+        return SharedMemory(name, create=create, size=size)
+
+    try:
+        return SharedMemory(name, create=create, size=size, track=False)
+    except TypeError:
+        # py<3.13 always registers the segment in the resource tracker, which would unlink it at exit.
+        # This relies on the private `_name` attribute
+        segment = SharedMemory(name, create=create, size=size)
+        if os.name == 'posix':
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(segment._name, 'shared_memory')
+        return segment
+
+
+def _detach(segment):
+    # `SharedMemory` can't be closed while its buffer is in use, so we take the mapping away from it.
+    # This relies on the private `_mmap` and `_buf` attributes of `SharedMemory`
+    segment.buf.release()
+    mapping = segment._mmap
+    segment._buf = segment._mmap = None
+    return mapping
@@ -54,8 +54,15 @@ setup(
             'nibabel',
             'numpy',
             'imageio>=2.0.0',
+            'scipy',
+            'tifffile',
         ]
     },
+    entry_points={
+        'console_scripts': [
+            'deli = deli.cli:run',
+        ],
+    },
     classifiers=CLASSIFIERS,
     keywords=KEYWORDS,
     python_requires='>=3.6',
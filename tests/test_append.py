@@ -0,0 +1,127 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from deli import save, load
+from deli.serializers import numpy_
+
+
+def test_numpy(tmpdir):
+    path = Path(tmpdir, 'file.npy')
+    parts = [np.random.randn(n, 3) for n in [5, 1, 0, 100]]
+    for part in parts:
+        save(part, path, mode='append')
+    np.testing.assert_array_equal(load(path), np.concatenate(parts))
+
+    # a safe cast is fine
+    save(np.ones((2, 3), int), path, mode='append')
+    with pytest.raises(ValueError):
+        save(np.ones((2, 4)), path, mode='append')
+    with pytest.raises(ValueError):
+        save(np.ones((2, 3), complex), path, mode='append')
+    assert load(path).shape == (108, 3)
+
+    with pytest.raises(ValueError):
+        save(np.ones(3), path, mode='overwrite')
+
+
+def test_numpy_without_padding(tmpdir):
+    # an old-style header, with no room for the growing shape
+    path = Path(tmpdir, 'file.npy')
+    with open(path, 'wb') as file:
+        header = b"{'descr': '<i8', 'fortran_order': False, 'shape': (2,), }"
+        file.write(b'\x93NUMPY\x01\x00' + (len(header) + 6).to_bytes(2, 'little') + header.ljust(len(header) + 5) + b'\n')
+        file.write(np.arange(2).tobytes())
+
+    for i in range(3):
+        save(np.arange(10 ** i) + 2, path, mode='append')
+    np.testing.assert_array_equal(load(path), np.concatenate([np.arange(2)] + [np.arange(10 ** i) + 2 for i in range(3)]))
+
+
+def forbid_rewrites(monkeypatch):
+    def rewrite(*args, **kwargs):
+        raise AssertionError('The file was rewritten')
+
+    monkeypatch.setattr(numpy_, 'save_array', rewrite)
+
+
+def test_numpy_in_place(tmpdir, monkeypatch):
+    # deli's own header always has room for the shape to grow, regardless of numpy's version
+    path = Path(tmpdir, 'file.npy')
+    save(np.arange(3), path)
+    forbid_rewrites(monkeypatch)
+    for i in range(5):
+        save(np.arange(10 ** i), path, mode='append')
+    np.testing.assert_array_equal(load(path), np.concatenate([np.arange(3)] + [np.arange(10 ** i) for i in range(5)]))
+
+
+def test_numpy_padding_after_rewrite(tmpdir, monkeypatch):
+    path = Path(tmpdir, 'file.npy')
+    with open(path, 'wb') as file:
+        header = b"{'descr': '<i8', 'fortran_order': False, 'shape': (1,), }"
+        file.write(b'\x93NUMPY\x01\x00' + (len(header) + 1).to_bytes(2, 'little') + header + b'\n')
+        file.write(np.arange(1).tobytes())
+
+    # the first append has to rewrite the file, but the new header is padded
+    save(np.arange(100), path, mode='append')
+    forbid_rewrites(monkeypatch)
+    save(np.arange(10 ** 6), path, mode='append')
+    assert load(path).shape == (1 + 100 + 10 ** 6,)
+
+
+@pytest.mark.parametrize('value', [
+    np.zeros(3, [('名', float)]),
+    np.zeros((123, 1, 1, 1, 1, 1), [('a', 'i4'), ('b', 'f8')]),
+    np.asfortranarray(np.ones((3, 4))),
+    np.arange(100).reshape(10, 10)[:, ::3],
+    np.float32(3),
+])
+# numpy warns about the format 3.0 for non-latin field names
+@pytest.mark.filterwarnings('ignore:Stored array in format')
+def test_numpy_format(tmpdir, value):
+    path = Path(tmpdir, 'file.npy')
+    save(value, path)
+    np.testing.assert_array_equal(load(path), value)
+    if hasattr(np.lib.format, 'GROWTH_AXIS_MAX_DIGITS'):
+        # numpy>=1.24 pads the header the same way
+        expected = Path(tmpdir, 'expected.npy')
+        np.save(expected, value)
+        assert path.read_bytes() == expected.read_bytes()
+
+    if value.ndim and value.flags.c_contiguous:
+        save(value[:2], path, mode='append')
+        assert len(load(path)) == len(value) + 2
+
+
+def test_numpy_failure_keeps_file(tmpdir):
+    path = Path(tmpdir, 'file.npy')
+    save(np.arange(3), path)
+    with pytest.raises(ValueError):
+        save(np.array([{}, []], dtype=object), path)
+    np.testing.assert_array_equal(load(path), np.arange(3))
+
+
+def test_csv(tmpdir):
+    path = Path(tmpdir, 'file.csv')
+    first = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+    second = pd.DataFrame({'a': [3], 'b': ['z']})
+    save(first, path, index=False, mode='append')
+    save(second, path, index=False, mode='append')
+    pd.testing.assert_frame_equal(load(path), pd.concat([first, second], ignore_index=True))
+
+    with pytest.raises(ValueError):
+        save(second[['b', 'a']], path, index=False, mode='append')
+    with pytest.raises(ValueError):
+        save(second, path, mode='append')
+
+
+def test_json_lines(tmpdir):
+    path = Path(tmpdir, 'file.jsonl')
+    save([{'a': 1, 'b': [1, 2]}], path)
+    save([{'a': 2, 'b': None}, {'b': 3, 'a': 4}], path, mode='append')
+    assert load(path) == [{'a': 1, 'b': [1, 2]}, {'a': 2, 'b': None}, {'a': 4, 'b': 3}]
+
+    with pytest.raises(ValueError):
+        save([{'a': 2}], path, mode='append')
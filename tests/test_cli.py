@@ -0,0 +1,58 @@
+import gzip
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from deli import load, save
+from deli.cli import main
+
+
+def test_convert(tmpdir):
+    tmpdir = Path(tmpdir)
+    arrays = [np.random.randn(10, 10) for _ in range(3)]
+    sources = []
+    for i, array in enumerate(arrays):
+        sources.append(tmpdir / f'{i}.npy.gz')
+        save(array, sources[-1])
+
+    assert main(['convert', *map(str, sources), '--to', '.npy', '--jobs', '2']) == 0
+    for i, array in enumerate(arrays):
+        np.testing.assert_array_equal(load(tmpdir / f'{i}.npy'), array)
+
+    # up-to-date outputs are skipped
+    (tmpdir / '0.npy').write_bytes(b'')
+    assert main(['convert', str(sources[0]), '--to', '.npy']) == 0
+    assert (tmpdir / '0.npy').read_bytes() == b''
+    assert main(['convert', str(sources[0]), '--to', '.npy', '--force']) == 0
+    np.testing.assert_array_equal(load(tmpdir / '0.npy'), arrays[0])
+
+    output = tmpdir / 'output'
+    assert main(['convert', str(sources[1]), '--to', '.npy.gz', '-o', str(output), '-c', '9']) == 0
+    with gzip.open(output / '1.npy.gz') as file:
+        np.testing.assert_array_equal(np.load(file), arrays[1])
+
+
+def test_in_place(tmpdir):
+    tmpdir = Path(tmpdir)
+    array = np.zeros((100, 100))
+    path = tmpdir / 'file.npy.gz'
+    save(array, path, compression=1)
+    size = path.stat().st_size
+
+    # the target is the source itself, which is never up to date
+    assert main(['convert', str(path), '--to', '.npy.gz', '-c', '9']) == 0
+    assert path.stat().st_size < size
+    np.testing.assert_array_equal(load(path), array)
+    assert [x.name for x in tmpdir.iterdir()] == ['file.npy.gz']
+
+
+def test_failures(tmpdir):
+    source = Path(tmpdir, 'file.json')
+    save({'a': 1}, source)
+    assert main(['convert', str(source), '--to', '.npy']) == 1
+
+    result = subprocess.run([sys.executable, '-m', 'deli', 'convert', str(source), '--to', '.npy'],
+                            cwd=Path(__file__).resolve().parent.parent)
+    assert result.returncode == 1
@@ -0,0 +1,43 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from deli import DedupStore
+
+
+def _chunks(root):
+    return {x.name for x in Path(root, 'chunks').rglob('*') if x.is_file()}
+
+
+def test_dedup(tmpdir):
+    store = DedupStore(tmpdir, chunk_size=2 ** 12)
+    first = np.random.randint(0, 256, size=(500, 1000), dtype=np.uint8)
+    second = first.copy()
+    second[200:210, 300:400] = 0
+
+    store.save(first, 'first.npy')
+    before = _chunks(tmpdir)
+    store.save(second, 'nested/second.npy')
+    after = _chunks(tmpdir)
+    assert len(after - before) <= 15
+    assert len(before) > 50
+
+    np.testing.assert_array_equal(store.load('first.npy'), first)
+    np.testing.assert_array_equal(store.load('nested/second.npy'), second)
+    assert 'first.npy' in store and 'third.npy' not in store
+
+    # shifting the content doesn't change most chunks
+    store.save(np.concatenate([np.zeros(17, np.uint8), first.ravel()]), 'shifted.npy')
+    assert len(_chunks(tmpdir) - after) <= 5
+
+
+def test_other_values(tmpdir):
+    store = DedupStore(tmpdir)
+    assert store.save({'a': [1, 2]}, 'file.json') == '.json'
+    assert store.load('file.json') == {'a': [1, 2]}
+    assert store.save('', 'file', hint='.txt') == '.txt'
+    assert store.load('file') == ''
+
+    with pytest.raises(ValueError):
+        DedupStore(tmpdir, chunk_size=1000)
@@ -0,0 +1,47 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from deli import save, load
+
+
+def _touch_old(path):
+    os.utime(path, ns=(0, 0))
+
+
+@pytest.mark.parametrize('name, first, second', [
+    ('file.json', {'a': [1, 2, 3]}, {'a': [1, 2]}),
+    ('file.json', {'a': [1, 2]}, {'a': [1, 2, 3]}),
+    ('file.npy', np.arange(10), np.arange(10) * 2),
+    ('file.npy.gz', np.arange(1000), np.arange(1000)[::-1]),
+    ('file.txt', 'abc', 'abd'),
+])
+def test_if_changed(tmpdir, name, first, second):
+    path = Path(tmpdir, name)
+    save(first, path)
+    _touch_old(path)
+
+    save(first, path, if_changed=True)
+    assert path.stat().st_mtime_ns == 0
+
+    save(second, path, if_changed=True)
+    assert path.stat().st_mtime_ns != 0
+    with path.open('rb') as actual:
+        # gzip stores the file's name, so it must be the same
+        expected = Path(tmpdir, 'expected', name)
+        expected.parent.mkdir()
+        save(second, expected)
+        assert actual.read() == expected.read_bytes()
+
+    if isinstance(second, np.ndarray):
+        np.testing.assert_array_equal(load(path), second)
+    else:
+        assert load(path) == second
+
+
+def test_new_file(tmpdir):
+    path = Path(tmpdir, 'file.json')
+    save([1, 2], path, if_changed=True)
+    assert load(path) == [1, 2]
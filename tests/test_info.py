@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from deli import info, save, load, Info, WrongSerializer
+
+
+@pytest.mark.parametrize('name, value', [
+    ('file.npy', np.zeros((3, 4, 5), np.float32)),
+    ('file.npy.gz', np.zeros((30, 40), np.int16)),
+    ('file.png', np.zeros((30, 40, 3), np.uint8)),
+    ('file.png', np.zeros((30, 40), np.uint16)),
+    ('file.tif', np.zeros((30, 40, 4), np.uint8)),
+    ('file.tif', np.zeros((30, 40), np.float32)),
+    # planar channels
+    ('file.tif', np.zeros((3, 30, 40), np.uint8)),
+    ('file.png', np.zeros((30, 40), bool)),
+])
+def test_arrays(tmpdir, name, value):
+    path = Path(tmpdir, name)
+    save(value, path)
+    result = info(path)
+    loaded = load(path)
+    assert result == Info(result.format, loaded.shape, loaded.dtype, loaded.nbytes)
+    assert name.endswith(result.format)
+
+
+def test_partial_decompression(tmpdir):
+    path = Path(tmpdir, 'file.npy.gz')
+    save(np.random.randn(1000, 1000), path)
+    # a broken stream is fine, as long as the header is intact
+    path.write_bytes(path.read_bytes()[:2 ** 16])
+    with pytest.raises(EOFError):
+        load(path)
+    assert info(path).shape == (1000, 1000)
+
+
+def test_other(tmpdir, tests_root):
+    assert info(tests_root / 'assets' / 'file.csv') == Info('.csv', (None, 2), None, None)
+    with pytest.raises(WrongSerializer):
+        info(tests_root / 'assets' / 'file.json')
+
+
+def test_broken_png(tmpdir):
+    path = Path(tmpdir, 'file.png')
+    save(np.zeros((30, 40), np.uint8), path)
+    content = bytearray(path.read_bytes())
+    # the IHDR's color type
+    content[25] = 5
+    path.write_bytes(bytes(content))
+    with pytest.raises(WrongSerializer):
+        info(path)
+
+
+@pytest.mark.parametrize('name', ['CT_small.dcm', 'MR_small.dcm'])
+def test_dicom(name):
+    pytest.importorskip('pydicom')
+    from pydicom.data import get_testdata_file
+
+    path = get_testdata_file(name)
+    pixels = load(path).pixel_array
+    assert info(path) == Info('.dcm', pixels.shape, pixels.dtype, pixels.nbytes)
+
+
+@pytest.mark.parametrize('name', ['file.nii', 'file.nii.gz'])
+def test_nifti(tmpdir, name):
+    nibabel = pytest.importorskip('nibabel')
+    path = Path(tmpdir, name)
+    save(nibabel.Nifti1Image(np.zeros((10, 20, 30), np.int16), np.eye(4)), path)
+    data = np.asanyarray(load(path).dataobj)
+    assert info(path) == Info(name[4:], data.shape, data.dtype, data.nbytes)
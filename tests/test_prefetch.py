@@ -0,0 +1,54 @@
+import importlib
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from deli import save, prefetch
+
+
+@pytest.fixture
+def paths(tmpdir):
+    paths = []
+    for i in range(20):
+        path = Path(tmpdir, f'{i}.npy')
+        save(np.full(1000, i), path)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize('processes', [False, True])
+def test_order(paths, processes):
+    values = list(prefetch(paths, workers=4, processes=processes))
+    assert [value[0] for value in values] == list(range(len(paths)))
+
+
+def test_errors(paths):
+    paths = paths[:3] + [Path(paths[0].parent, 'missing.npy')] + paths[3:]
+    with prefetch(paths) as values:
+        assert [next(values)[0] for _ in range(3)] == [0, 1, 2]
+        with pytest.raises(FileNotFoundError):
+            next(values)
+        # the following values are still available
+        assert [value[0] for value in values] == list(range(3, 20))
+
+
+def test_budget(paths, monkeypatch):
+    # track how many values are loaded ahead of the consumer
+    lock, loaded = threading.Lock(), []
+
+    def load(source, **kwargs):
+        with lock:
+            loaded.append(source)
+        return np.zeros(1000)
+
+    monkeypatch.setattr(importlib.import_module('deli.prefetch'), 'load', load)
+    values = prefetch(paths, workers=4, max_bytes=8000 * 2)
+    for i, _ in enumerate(values):
+        time.sleep(0.01)
+        # the budget allows for 2 values in flight, while the pool alone would allow for 8
+        assert len(loaded) - i - 1 <= 2
+
+    assert len(loaded) == len(paths)
@@ -0,0 +1,122 @@
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from socketserver import ThreadingMixIn
+
+import numpy as np
+import pytest
+
+from deli import save, load, info
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_HEAD(self):
+        self.reply(False)
+
+    def do_GET(self):
+        self.reply(True)
+
+    def reply(self, body):
+        server = self.server
+        server.connections.add(self.client_address)
+        path = Path(server.root, self.path.lstrip('/').split('?')[0])
+        if not path.is_file():
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        data = path.read_bytes()
+        match = re.fullmatch(r'bytes=(\d+)-(\d+)', self.headers.get('Range', ''))
+        if match and server.ranges:
+            start, stop = int(match.group(1)), min(int(match.group(2)) + 1, len(data))
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{stop - 1}/{len(data)}')
+            data = data[start:stop]
+        else:
+            self.send_response(200)
+
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if body:
+            server.sent += len(data)
+            self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+# `http.server.ThreadingHTTPServer` requires py>=3.7
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def server(tmpdir):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.root, server.ranges, server.sent, server.connections = Path(tmpdir), True, 0, set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def url(server, name):
+    return f'http://127.0.0.1:{server.server_address[1]}/{name}'
+
+
+def test_load(server):
+    array = np.random.randint(0, 1000, (1000, 1000))
+    save(array, server.root / 'array.npy')
+    save(array, server.root / 'array.npy.gz')
+    save({'a': [1, 2]}, server.root / 'file.json')
+
+    np.testing.assert_array_equal(load(url(server, 'array.npy')), array)
+    np.testing.assert_array_equal(load(url(server, 'array.npy.gz?version=1')), array)
+    assert load(url(server, 'file.json')) == {'a': [1, 2]}
+    # the connection is reused
+    assert len(server.connections) == 1
+
+    with pytest.raises(FileNotFoundError):
+        load(url(server, 'missing.npy'))
+
+
+def test_partial(server):
+    array = np.random.randint(0, 1000, (1000, 1000))
+    save(array, server.root / 'array.npy')
+    size = (server.root / 'array.npy').stat().st_size
+
+    assert info(url(server, 'array.npy')).shape == array.shape
+    with load(url(server, 'array.npy'), lazy=True) as lazy:
+        np.testing.assert_array_equal(lazy[-5:], array[-5:])
+    assert server.sent < size // 10
+    # the remote file is closed together with the array
+    file, = lazy.owned
+    assert file.closed
+
+    save(array, server.root / 'array.npy.gz', seekable=True)
+    with load(url(server, 'array.npy.gz'), lazy=True) as lazy:
+        np.testing.assert_array_equal(lazy[-5:], array[-5:])
+    # both the decompressor and the remote file
+    assert len(lazy.owned) == 2 and all(stream.closed for stream in lazy.owned)
+
+    # the whole file is downloaded once
+    server.ranges, server.sent = False, 0
+    lazy = load(url(server, 'array.npy'), lazy=True)
+    np.testing.assert_array_equal(lazy[-5:], array[-5:])
+    np.testing.assert_array_equal(load(url(server, 'array.npy')), array)
+    assert server.sent == 2 * size
+
+
+def test_ranges_ignored_later(server):
+    array = np.random.randint(0, 1000, (1000, 1000))
+    save(array, server.root / 'array.npy')
+    with load(url(server, 'array.npy'), lazy=True) as lazy:
+        # e.g. a proxy that starts ignoring the ranges after the first request
+        server.ranges = False
+        np.testing.assert_array_equal(lazy[-5:], array[-5:])
+        np.testing.assert_array_equal(lazy[500], array[500])
@@ -0,0 +1,100 @@
+import gzip
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from deli import save, load
+from deli.serializers.numpy_ import LazyArray
+from deli.serializers.seekable_gzip import SeekableGzip, IndexWriter
+
+
+@pytest.fixture
+def array():
+    return np.random.randint(0, 1000, (500, 1000))
+
+
+def test_regular_gzip(tmpdir, array):
+    path = Path(tmpdir, 'file.npy.gz')
+    assert save(array, path, seekable=True) == '.npy.gz'
+    with gzip.open(path) as file:
+        np.testing.assert_array_equal(np.load(file), array)
+    np.testing.assert_array_equal(load(path), array)
+
+
+def compress(data, seekable):
+    buffer = BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb', mtime=0) as file:
+        local = IndexWriter(file, buffer, 0, span=2 ** 16) if seekable else file
+        local.write(data)
+    if seekable:
+        buffer.write(local.index_member())
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize('seekable', [False, True])
+def test_seek(seekable):
+    data = np.random.randint(0, 10, 10 ** 6, np.uint8).tobytes()
+    payload = compress(data, seekable)
+    assert gzip.decompress(payload) == data
+
+    stream = SeekableGzip(BytesIO(payload))
+    assert bool(stream.points) == seekable
+    for start in [len(data) - 10, 5, 2 ** 16 + 3, 0, len(data) // 2, 2 ** 17]:
+        assert stream.seek(start) == start
+        assert stream.read(100) == data[start:start + 100]
+    position = stream.tell()
+    assert stream.read() == data[position:]
+    assert stream.read() == b''
+    assert stream.seek(0, 2) == len(data)
+
+
+def test_lazy(tmpdir, array):
+    path = Path(tmpdir, 'file.npy.gz')
+    save(array, path, seekable=True)
+    with load(path, lazy=True) as lazy:
+        assert isinstance(lazy, LazyArray)
+        assert lazy.shape == array.shape and lazy.dtype == array.dtype and len(lazy) == len(array)
+        for key in [-1, 3, slice(-3, None), slice(10, 2, -3), slice(None, None, 7), (slice(5, 9), 4), (-2, -1),
+                    [1, 3], slice(5, 5)]:
+            np.testing.assert_array_equal(lazy[key], array[key])
+        np.testing.assert_array_equal(np.asarray(lazy), array)
+
+        with pytest.raises(IndexError):
+            lazy[len(array)]
+
+    # without the index the stream is decompressed from the start
+    save(array, path)
+    with load(path, lazy=True) as lazy:
+        np.testing.assert_array_equal(lazy[-2:], array[-2:])
+
+    fortran = np.asfortranarray(array)
+    save(fortran, path, seekable=True)
+    with load(path, lazy=True) as lazy:
+        np.testing.assert_array_equal(lazy[7], fortran[7])
+
+    lazy = load(BytesIO(path.read_bytes()), '.npy.gz', lazy=True)
+    np.testing.assert_array_equal(lazy[100:110], fortran[100:110])
+
+    path = Path(tmpdir, 'file.npy')
+    save(array, path)
+    assert isinstance(load(path, lazy=True), np.memmap)
+
+
+def test_lazy_closes_file(tmpdir, array):
+    path = Path(tmpdir, 'file.npy.gz')
+    save(array, path, seekable=True)
+    with load(path, lazy=True) as lazy:
+        local, = lazy.owned
+        file = local.source
+        np.testing.assert_array_equal(lazy[-1], array[-1])
+        assert not file.closed
+
+    assert local.closed and file.closed
+
+    # buffers belong to the caller
+    buffer = BytesIO(path.read_bytes())
+    with load(buffer, '.npy.gz', lazy=True) as lazy:
+        np.testing.assert_array_equal(lazy[0], array[0])
+    assert not buffer.closed
@@ -1,3 +1,4 @@
+from io import BytesIO
 from pathlib import Path
 
 import pytest
@@ -39,3 +40,33 @@ def test_no_extension(tmpdir):
 def test_not_found_file():
     with pytest.raises(FileNotFoundError):
         load('/some/file.json')
+
+
+def test_save_skips_unsuitable_serializers():
+    class Buffer(BytesIO):
+        def truncate(self, size=None):
+            raise AssertionError('A serializer wrote partial data')
+
+    buffer = Buffer()
+    assert save({'key': [1, 2, {3}]}, buffer, hint=None) == '.pkl'
+    buffer.seek(0)
+    assert load(buffer, hint='.pkl') == {'key': [1, 2, {3}]}
+
+    buffer = Buffer()
+    assert save({'key': [1, 2, (3,)]}, buffer, hint=None) == '.json'
+
+
+def test_hinted_json_skips_precheck(monkeypatch):
+    from deli.serializers import packaged
+
+    def precheck(value, _visited=None):
+        raise AssertionError('The value was prechecked')
+
+    monkeypatch.setattr(packaged, '_is_jsonable', precheck)
+    buffer = BytesIO()
+    assert save({'key': [1, 2]}, buffer, hint='.json') == '.json'
+    buffer.seek(0)
+    assert load(buffer, hint='.json') == {'key': [1, 2]}
+
+    with pytest.raises(WrongSerializer):
+        save({'key': {1}}, BytesIO(), hint='.json')
@@ -0,0 +1,46 @@
+import uuid
+
+import numpy as np
+import pytest
+
+from deli import save, load, unlink_shared
+
+# py>=3.8
+pytest.importorskip('multiprocessing.shared_memory')
+
+
+@pytest.fixture
+def segment():
+    name = f'shm://deli-{uuid.uuid4().hex[:8]}'
+    yield name
+    try:
+        unlink_shared(name)
+    except FileNotFoundError:
+        pass
+
+
+def test_array(segment):
+    value = np.random.randn(10, 20, 3)
+    name = segment + '.npy'
+    assert save(value, name) == '.npy'
+    loaded = load(name)
+    np.testing.assert_array_equal(loaded, value)
+    assert not loaded.flags.owndata and not loaded.flags.writeable
+
+    # the array outlives the segment
+    unlink_shared(name)
+    np.testing.assert_array_equal(loaded, value)
+    with pytest.raises(FileNotFoundError):
+        load(name)
+
+    value = np.asfortranarray(value)
+    save(value, name)
+    np.testing.assert_array_equal(load(name), value)
+    unlink_shared(name)
+
+
+def test_serialized(segment):
+    value = {'a': [1, 2, 3], 'b': None}
+    name = segment + '.json'
+    assert save(value, name) == '.json'
+    assert load(name) == value
@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import scipy.sparse
+
+from deli import save, load
+
+
+@pytest.mark.parametrize('kind', ['csr', 'csc', 'coo', 'bsr'])
+@pytest.mark.parametrize('name', ['file.npz', 'file.npz.gz'])
+def test_sparse(tmpdir, kind, name):
+    path = Path(tmpdir, name)
+    value = scipy.sparse.random(100, 60, 0.1, format=kind, dtype=np.float32)
+    save(value, path)
+    loaded = load(path)
+    assert loaded.format == kind and loaded.dtype == value.dtype
+    np.testing.assert_array_equal(loaded.toarray(), value.toarray())
+
+
+@pytest.mark.parametrize('kind', ['csr', 'coo'])
+def test_mmap(tmpdir, kind):
+    path = Path(tmpdir, 'file.npz')
+    value = scipy.sparse.random(1000, 600, 0.01, format=kind)
+    save(value, path)
+    loaded = load(path, mmap_mode='r')
+    # the components are views of the mapped file
+    assert not loaded.data.flags.owndata
+    np.testing.assert_array_equal(loaded.toarray(), value.toarray())
+
+    save(value, path, compressed=True)
+    np.testing.assert_array_equal(load(path).toarray(), value.toarray())
+    with pytest.raises(ValueError):
+        load(path, mmap_mode='r')
+
+
+@pytest.mark.parametrize('params', [{}, {'mmap_mode': 'r'}])
+def test_regular_archive(tmpdir, params):
+    from deli import WrongSerializer
+    from deli.serializers.sparse import Sparse
+
+    path = Path(tmpdir, 'file.npz')
+    np.savez(path, a=np.arange(3))
+    with pytest.raises(ValueError, match='does not contain a sparse'):
+        load(path, **params)
+    with pytest.raises(WrongSerializer):
+        Sparse().load(path, None, params)
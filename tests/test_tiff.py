@@ -0,0 +1,25 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from deli import save, load
+
+# the tiled format is only registered if tifffile is installed
+pytest.importorskip('tifffile')
+
+
+@pytest.mark.parametrize('shape', [(300, 500), (300, 500, 3)])
+@pytest.mark.parametrize('compression', [None, 'zlib'])
+def test_region(tmpdir, shape, compression):
+    path = Path(tmpdir, 'file.tif')
+    value = np.random.randint(0, 256, shape, dtype=np.uint8)
+    save(value, path, tile=(64, 128), compression=compression)
+    np.testing.assert_array_equal(load(path), value)
+    np.testing.assert_array_equal(load(path, region=None), value)
+
+    for region in [
+        np.s_[10:200, 30:150], np.s_[:, 499:], np.s_[100:101], np.s_[-50:, ::3], np.s_[5:5, 10:20],
+        np.s_[::7, 100:400:2, ...], (slice(None), slice(None), 0) if len(shape) == 3 else np.s_[:, :, None],
+    ]:
+        np.testing.assert_array_equal(load(path, region=region, workers=2), value[region])